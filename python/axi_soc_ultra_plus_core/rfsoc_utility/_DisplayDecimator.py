@@ -0,0 +1,56 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+enumDecimationMode = {
+    0 : 'MinMax', # Min/max envelope: 2 points per bin (time traces)
+    1 : 'Peak',   # Peak preserving: max value per bin (spectra)
+}
+
+# Reduces a fixed-size array to about 'points' display points
+class DisplayDecimator(object):
+    def __init__(self, size, points, mode='MinMax'):
+        if mode not in enumDecimationMode.values():
+            raise ValueError(f'Unknown decimation mode "{mode}"')
+        self.size   = int(size)
+        self.points = int(points)
+        self.mode   = mode
+
+        # Number of bins (the min/max envelope emits 2 points per bin)
+        numBins = (self.points>>1) if (mode == 'MinMax') else self.points
+        numBins = max(1, min(numBins, self.size))
+        self.bypass = (numBins == self.size) or (self.points >= self.size)
+
+        # Start index of each bin, used by the ufunc reduceat() calls
+        self._start = (np.arange(numBins, dtype=np.int64)*self.size)//numBins
+
+    def decimate(self, data):
+        # Returns a new (small) array that is safe to publish
+        if self.bypass:
+            return np.array(data, copy=True)
+
+        if self.mode == 'Peak':
+            return np.maximum.reduceat(data, self._start)
+
+        retVar = np.empty(2*len(self._start), dtype=data.dtype)
+        np.minimum.reduceat(data, self._start, out=retVar[0::2])
+        np.maximum.reduceat(data, self._start, out=retVar[1::2])
+        return retVar
+
+    def axis(self, x):
+        # Returns the x-axis matching decimate()
+        x = np.asarray(x)
+        if self.bypass:
+            return np.array(x, copy=True)
+        if self.mode == 'Peak':
+            return x[self._start]
+        # Both points of a bin share the x value so the envelope draws as a vertical segment
+        return np.repeat(x[self._start], 2)
@@ -0,0 +1,132 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import collections
+import threading
+
+enumDropPolicy = {
+    0 : 'NewestWins', # Queue full: drop the oldest queued item to make room
+    1 : 'OldestWins', # Queue full: drop the incoming item
+    2 : 'Block',      # Queue full: block the producer until there is room
+}
+
+# Bounded queue serviced by a single worker thread
+class FrameWorkQueue(object):
+    def __init__(self, handler, release=None, depth=4, policy='NewestWins', name='FrameWorkQueue'):
+        if policy not in enumDropPolicy.values():
+            raise ValueError(f'Unknown drop policy "{policy}", must be one of {list(enumDropPolicy.values())}')
+
+        self._handler = handler # Called in the worker thread for every item
+        self._release = release # Called for every item once processed or dropped
+        self._depth   = max(1, int(depth))
+        self._name    = name
+        self.policy   = policy
+
+        self._items  = collections.deque()
+        self._cond   = threading.Condition()
+        self._thread = None
+        self._run    = False
+
+        self.accepted  = 0
+        self.dropped   = 0
+        self.processed = 0
+
+    @property
+    def depth(self):
+        return self._depth
+
+    def __len__(self):
+        return len(self._items)
+
+    def countReset(self):
+        with self._cond:
+            self.accepted  = 0
+            self.dropped   = 0
+            self.processed = 0
+
+    def start(self):
+        with self._cond:
+            if self._run:
+                return
+            self._run = True
+        self._thread = threading.Thread(target=self._worker, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._run = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        # Release anything still queued
+        while self._items:
+            self._drop(self._items.popleft())
+
+    def put(self, item):
+        # Returns True if the item was queued
+        with self._cond:
+            if not self._run:
+                self.dropped += 1
+                evicted = item
+
+            elif len(self._items) < self._depth:
+                evicted = None
+
+            elif self.policy == 'NewestWins':
+                evicted = self._items.popleft()
+                self.dropped += 1
+
+            elif self.policy == 'OldestWins':
+                self.dropped += 1
+                evicted = item
+
+            else:
+                while self._run and (len(self._items) >= self._depth):
+                    self._cond.wait()
+                if self._run:
+                    evicted = None
+                else:
+                    self.dropped += 1
+                    evicted = item
+
+            if evicted is not item:
+                self._items.append(item)
+                self.accepted += 1
+                self._cond.notify_all()
+
+        if evicted is not None:
+            self._drop(evicted)
+        return evicted is not item
+
+    def _drop(self, item):
+        if self._release is not None:
+            self._release(item)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._run and not self._items:
+                    self._cond.wait()
+                if not self._run:
+                    return
+                item = self._items.popleft()
+                # Wake up a blocked producer
+                self._cond.notify_all()
+
+            try:
+                self._handler(item)
+            except Exception as e:
+                print(f'{self._name}: {e}')
+
+            with self._cond:
+                self.processed += 1
+            self._drop(item)
@@ -0,0 +1,341 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import rogue.interfaces.stream as ris
+import pyrogue as pr
+import numpy as np
+import threading
+
+import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
+
+# Stream slave for a single channel of the MultiChannelRingBufferProcessor
+class RingBufferChannelPort(ris.Slave):
+    def __init__(self, parent, ch):
+        ris.Slave.__init__(self)
+        self._parent = parent
+        self._ch     = ch
+
+    def _acceptFrame(self, frame):
+        self._parent._acceptChannel(self._ch, frame)
+
+# Collects one frame from every channel into a [numCh, maxSize] array
+# and runs a single vectorized FFT/averaging pass for all of them
+class MultiChannelRingBufferProcessor(pr.Device):
+    def __init__( self,
+            numCh       = 8,
+            maxSize     = 2**14,
+            sampleRate  = 5.0E+9, # Units of Hz
+            maxAve      = 256,
+            defaultAve  = 4,
+            aveMode     = 'Running', # See rfsoc_utility.enumFftAveragingMode
+            aveDomain   = 'dB',      # See rfsoc_utility.enumFftAveragingDomain
+            window      = 'Rectangular', # See rfsoc_utility.enumFftWindow
+            metrics     = False, # True to compute SNR/SFDR/SINAD/ENOB/THD from the averaged spectra
+            enableOnStart = True,
+            hidden      = True,
+            **kwargs):
+        super().__init__(hidden=hidden, **kwargs)
+
+        # Not saving config/state to YAML
+        guiGroups = ['NoStream','NoState','NoConfig']
+
+        # Configurable variables
+        self._numCh    = numCh
+        self._maxSize  = maxSize
+        self._timeBin  = (1.0E+9/sampleRate) # Units of ns
+        self._maxAve   = maxAve
+        self._enableOnStart = enableOnStart
+        self._metrics  = metrics
+
+        # Init variables
+        self._freqBin  = ((0.5E+3/self._timeBin)/float(self._maxSize>>1)) # Units of MHz
+        self._allMask  = (1<<numCh)-1
+        self._pending  = 0
+        self._lastMask = 0
+        self._lock     = threading.Lock() # Channel rows and pending mask
+        self._procLock = threading.Lock() # Spectral engine and averager
+        self._data     = np.zeros(shape=(numCh,maxSize), dtype=np.int16, order='C')
+        self._engine   = rfsoc_utility.SpectralEngine(window=window)
+        self._averager = rfsoc_utility.SpectrumAverager(
+            shape  = (numCh,maxSize>>1),
+            depth  = min(defaultAve,maxAve),
+            mode   = aveMode,
+            domain = aveDomain,
+        )
+        self._ports = [RingBufferChannelPort(self,i) for i in range(numCh)]
+
+        # Calculate the time/frequency x-axis arrays
+        timeSteps = np.linspace(0, self._timeBin*(self._maxSize-1), num=self._maxSize)
+        freqSteps = np.linspace(0, self._freqBin*((self._maxSize>>1)-1), num=(self._maxSize>>1))
+
+        self.add(pr.LocalVariable(
+            name        = 'RxEnable',
+            description = 'Frame Rx Enable',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'EnableMask',
+            description = 'Bit mask of the channels that must arrive before a set is processed',
+            value       = self._allMask,
+            typeStr     = 'UInt32',
+            disp        = '{:#x}',
+            groups      = guiGroups,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'FrameCount',
+            description  = 'Frame Rx Counter',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'SetCount',
+            description  = 'Number of complete channel sets processed',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'ErrorCount',
+            description  = 'Frame Error Counter',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Time',
+            description = 'Time steps (ns)',
+            typeStr     = 'Float[np]',
+            value       = timeSteps,
+            hidden      = True,
+            groups      = guiGroups,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Freq',
+            description = 'Freq steps (MHz)',
+            typeStr     = 'Float[np]',
+            value       = freqSteps,
+            hidden      = True,
+            groups      = guiGroups,
+        ))
+
+        for i in range(numCh):
+
+            self.add(pr.LocalVariable(
+                name        = f'WaveformData[{i}]',
+                description = 'Data Frame Container',
+                typeStr     = 'Int16[np]',
+                value       = np.zeros(shape=self._maxSize, dtype=np.int16, order='C'),
+                hidden      = True,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = f'Magnitude[{i}]',
+                description = 'Magnitude Frame Container',
+                typeStr     = 'Float[np]',
+                value       = np.zeros(shape=(self._maxSize>>1), dtype=np.float32, order='C'),
+                hidden      = True,
+                groups      = guiGroups,
+            ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FftAveraging',
+            description = 'Number of FFTs to average together',
+            localSet    = self._fftAveraging,
+            mode        = 'RW',
+            typeStr     = 'UInt12',
+            value       = min(defaultAve,self._maxAve),
+            minimum     = 1,
+            maximum     = self._maxAve,
+            groups      = guiGroups,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FftAveragingMode',
+            description = 'Running: boxcar average of the last FftAveraging spectra, Exponential: moving average with alpha=1/FftAveraging',
+            localSet    = self._fftAveragingMode,
+            mode        = 'RW',
+            value       = list(rfsoc_utility.enumFftAveragingMode.values()).index(aveMode),
+            enum        = rfsoc_utility.enumFftAveragingMode,
+            groups      = guiGroups,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FftAveragingDomain',
+            description = 'dB: average the dBFS values, Power: average the linear power then convert to dBFS',
+            localSet    = self._fftAveragingDomain,
+            mode        = 'RW',
+            value       = list(rfsoc_utility.enumFftAveragingDomain.values()).index(aveDomain),
+            enum        = rfsoc_utility.enumFftAveragingDomain,
+            groups      = guiGroups,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FftWindow',
+            description = 'Window function applied before the FFT',
+            localSet    = self._fftWindow,
+            mode        = 'RW',
+            value       = list(rfsoc_utility.enumFftWindow.values()).index(window),
+            enum        = rfsoc_utility.enumFftWindow,
+            groups      = guiGroups,
+        ))
+
+        if self._metrics:
+
+            self.add(pr.LocalVariable(
+                name        = 'NumHarmonics',
+                description = 'Number of harmonics (starting at the 2nd) counted as distortion',
+                mode        = 'RW',
+                typeStr     = 'UInt8',
+                value       = 5,
+                minimum     = 1,
+                maximum     = 16,
+                groups      = guiGroups,
+            ))
+
+            for i in range(numCh):
+
+                self.add(pr.LocalVariable(
+                    name        = f'FundamentalFreq[{i}]',
+                    description = 'Frequency of the largest non-DC bin',
+                    mode        = 'RO',
+                    value       = 0.0,
+                    units       = 'MHz',
+                    disp        = '{:.3f}',
+                    groups      = guiGroups,
+                ))
+
+                for name, _, units, desc in rfsoc_utility.spectralMetricVariables:
+                    self.add(pr.LocalVariable(
+                        name        = f'{name}[{i}]',
+                        description = desc,
+                        mode        = 'RO',
+                        value       = 0.0,
+                        units       = units,
+                        disp        = '{:.2f}',
+                        groups      = guiGroups,
+                    ))
+
+        self.add(pr.LocalVariable(
+            name   = 'NewDataReady',
+            value  = False,
+            groups = guiGroups,
+        ))
+
+        @self.command(description='Reset the frame counters')
+        def CountReset():
+            self.FrameCount.set(0)
+            self.SetCount.set(0)
+            self.ErrorCount.set(0)
+
+    def _start(self):
+        super()._start()
+        self.RxEnable.set(value=self._enableOnStart)
+
+    def _stop(self):
+        self.RxEnable.set(value=False)
+        super()._stop()
+
+    def port(self, ch):
+        # Stream slave to connect AppRingBufferEngine.Ch[ch] to
+        return self._ports[ch]
+
+    def _fftAveraging(self,value,changed):
+        if changed:
+            with self._procLock:
+                self._averager.configure(depth=int(value))
+
+    def _fftAveragingMode(self,value,changed):
+        if changed:
+            with self._procLock:
+                self._averager.configure(mode=rfsoc_utility.enumFftAveragingMode[value])
+
+    def _fftAveragingDomain(self,value,changed):
+        if changed:
+            with self._procLock:
+                self._averager.configure(domain=rfsoc_utility.enumFftAveragingDomain[value])
+
+    def _fftWindow(self,value,changed):
+        if changed:
+            with self._procLock:
+                self._engine.window = rfsoc_utility.enumFftWindow[value]
+                self._averager.reset()
+
+    def rstFftAveraging(self):
+        with self._procLock:
+            self._averager.reset()
+
+    # Method which is called when a frame is received on one of the channel ports
+    def _acceptChannel(self, ch, frame):
+        if self.RxEnable.value() is False:
+            return
+
+        with frame.lock(), self._lock:
+
+            # Check frame size and error flags
+            if (frame.getError() != 0) or ((frame.getPayload()//2) != self._maxSize):
+                self.ErrorCount += 1
+                return
+
+            # Copy into this channel's row (newest frame wins if the set is not complete yet)
+            frame.read(self._data[ch].view(np.uint8),0)
+            self._pending |= (1<<ch)
+            self.FrameCount += 1
+
+            # Wait for all the enabled channels
+            mask = self.EnableMask.value() & self._allMask
+            if (self._pending & mask) != mask:
+                return
+            self._pending = 0
+            if mask == 0:
+                return
+
+            # Snapshot the enabled rows so the other ports can keep filling theirs
+            rows = np.flatnonzero([(mask>>i) & 0x1 for i in range(self._numCh)])
+            data = self._data[rows]
+
+        # One vectorized FFT/averaging pass for the enabled channels, outside of the channel lock
+        with self._procLock:
+
+            # A channel that was just enabled starts a new average
+            fresh = np.flatnonzero([((mask & ~self._lastMask)>>i) & 0x1 for i in range(self._numCh)])
+            if len(fresh) > 0:
+                self._averager.reset(fresh)
+            self._lastMask = mask
+
+            power     = self._engine.power(data)
+            magnitude = self._averager.update(power, rows=rows)
+
+            # One vectorized figures of merit pass for the enabled channels
+            if self._metrics:
+                metrics = rfsoc_utility.spectralMetrics(
+                    power        = np.power(10.0, 0.1*magnitude.astype(np.float64)),
+                    window       = self._engine.window,
+                    numHarmonics = self.NumHarmonics.value(),
+                )
+
+            # Publish the per-channel results
+            with self.root.updateGroup():
+                for k, i in enumerate(rows):
+                    self.WaveformData[i].set(data[k],write=True)
+                    self.Magnitude[i].set(magnitude[k].copy(),write=True)
+                    if self._metrics:
+                        self.FundamentalFreq[i].set(float(metrics['fundamentalBin'][k])*self._freqBin)
+                        for name, key, _, _ in rfsoc_utility.spectralMetricVariables:
+                            getattr(self,name)[i].set(float(metrics[key][k]))
+                self.SetCount += 1
+                self.NewDataReady.set(True)
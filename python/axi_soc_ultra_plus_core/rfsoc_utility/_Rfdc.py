@@ -12,20 +12,54 @@
 # contained in the LICENSE.txt file.
 #-----------------------------------------------------------------------------
 
+import concurrent.futures
+import threading
+import time
+
 import pyrogue as pr
 import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
 
+# Must match the ASYNC_* definitions in PyRFdc.h
+enumAsyncState = {
+    0 : 'Idle',
+    1 : 'Busy',
+    2 : 'Done',
+    3 : 'Error',
+}
+
+enumAsyncCommand = {
+    0 : 'ResetAllAdc',
+    1 : 'ResetAllDac',
+    2 : 'StartUpAllAdc',
+    3 : 'StartUpAllDac',
+    4 : 'CustomStartUpAllAdc',
+    5 : 'CustomStartUpAllDac',
+    6 : 'SyncAdcTiles',
+    7 : 'SyncDacTiles',
+}
+
 class Rfdc(pr.Device):
     def __init__(
             self,
-            enAdcTile = None,
-            enDacTile = None,
-            gen3      = True, # True if using RFSoC GEN3 Hardware
+            enAdcTile    = None,
+            enDacTile    = None,
+            gen3         = True, # True if using RFSoC GEN3 Hardware
+            layout       = None, # (ADC, DAC) block masks from discoveredLayout(): only the present tiles/blocks are built
             **kwargs):
         super().__init__(**kwargs)
-        self.gen3      = gen3
-        self.enAdcTile = [True,True,True,True] if enAdcTile is None else enAdcTile
-        self.enDacTile = [True,True,True,True] if enDacTile is None else enDacTile
+        self.gen3         = gen3
+        self.enAdcTile    = [True,True,True,True] if enAdcTile is None else list(enAdcTile)
+        self.enDacTile    = [True,True,True,True] if enDacTile is None else list(enDacTile)
+        self.enAdcBlock   = [[True,True,True,True] for i in range(4)]
+        self.enDacBlock   = [[True,True,True,True] for i in range(4)]
+
+        # Layout bit (4*tile+block) set if the block is present, a tile without any is not built
+        if layout is not None:
+            for enTile, enBlock, mask in [(self.enAdcTile, self.enAdcBlock, layout[0]), (self.enDacTile, self.enDacBlock, layout[1])]:
+                for i in range(4):
+                    enBlock[i] = [bool((mask >> (4*i+j)) & 0x1) for j in range(4)]
+                    enTile[i]  = enTile[i] and any(enBlock[i])
+        self._asyncFuture = None
 
         #######################################################################################
         # https://docs.amd.com/r/en-US/pg269-rf-data-converter/IP-Version-Information-0x0000
@@ -115,7 +149,7 @@ class Rfdc(pr.Device):
             description  = 'This API function resets ALL ADC tiles',
             offset       = 0x10010,
             bitSize      = 1,
-            function     = lambda cmd: cmd.set(1), # Make sure to set rogue.root timeout > 2.0
+            function     = lambda cmd: cmd.set(1), # Make sure to set rogue.root timeout > 2.0 (or use ResetAll*Async)
         ))
 
         self.add(pr.RemoteCommand(
@@ -123,7 +157,7 @@ class Rfdc(pr.Device):
             description  = 'This API function resets ALL DAC tiles',
             offset       = 0x10014,
             bitSize      = 1,
-            function     = lambda cmd: cmd.set(1), # Make sure to set rogue.root timeout > 2.0
+            function     = lambda cmd: cmd.set(1), # Make sure to set rogue.root timeout > 2.0 (or use ResetAll*Async)
         ))
 
         #######################################################################################
@@ -614,6 +648,53 @@ class Rfdc(pr.Device):
             hidden       = True,
         ))
 
+        #######################################################################################
+        # Long running commands executed by PyRFdc on a worker thread: the transaction returns
+        # immediately (no root timeout constraint) and completion is read from AsyncState,
+        # which PyRFdc serves while the command runs. Other registers fail with a busy error,
+        # so the Rfdc polling is paused until the command finishes (see runAsync()).
+        #######################################################################################
+        for index, cmd in enumAsyncCommand.items():
+            custom = cmd.startswith('CustomStartUp')
+            self.add(pr.RemoteCommand(
+                name         = f'{cmd}Async',
+                description  = f'{cmd} on the PyRFdc worker thread, see AsyncState and waitAsync()' + (' (arg: StartState in BIT3:BIT0, EndState in BIT11:BIT8)' if custom else ''),
+                offset       = 0x15000+4*index,
+                bitSize      = 12 if custom else 1,
+                function     = (lambda cmd, arg: self._startAsync(cmd, arg)) if custom else (lambda cmd: self._startAsync(cmd, 1)),
+                hidden       = True,
+            ))
+
+        self.add(pr.RemoteVariable(
+            name         = 'AsyncState',
+            description  = 'State of the last ...Async command',
+            offset       = 0x15020,
+            bitSize      = 32,
+            mode         = 'RO',
+            enum         = enumAsyncState,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.RemoteVariable(
+            name         = 'AsyncCommand',
+            description  = 'Last ...Async command',
+            offset       = 0x15024,
+            bitSize      = 32,
+            mode         = 'RO',
+            enum         = enumAsyncCommand,
+            hidden       = True,
+        ))
+
+        self.add(pr.RemoteVariable(
+            name         = 'AsyncCount',
+            description  = 'Number of completed ...Async commands',
+            offset       = 0x15028,
+            bitSize      = 32,
+            mode         = 'RO',
+            disp         = '{:d}',
+            hidden       = True,
+        ))
+
         #######################################################################################
         #######################################################################################
         #######################################################################################
@@ -624,6 +705,7 @@ class Rfdc(pr.Device):
                     name       = f'AdcTile[{i}]',
                     isAdc      = True,
                     gen3       = gen3,
+                    enBlock    = self.enAdcBlock[i],
                     offset     = (0x0000+0x2000*i),
                     expand     = False,
                     enableDeps = [self.CheckAdcTileEnabled[i]],
@@ -635,17 +717,178 @@ class Rfdc(pr.Device):
                     name       = f'DacTile[{i}]',
                     isAdc      = False,
                     gen3       = gen3,
+                    enBlock    = self.enDacBlock[i],
                     offset     = (0x8000+0x2000*i),
                     expand     = False,
                     enableDeps = [self.CheckDacTileEnabled[i]],
                 ))
 
+        #######################################################################################
+        # Layout read from the firmware by Discover(): bit (4*tile+block) set if present
+        #######################################################################################
+        self.add(pr.LocalVariable(
+            name         = 'DiscoveredAdcBlocks',
+            description  = 'Present RF-ADC blocks, bit (4*tile+block), updated by Discover()',
+            mode         = 'RO',
+            value        = 0,
+            disp         = '{:#06x}',
+            hidden       = True,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'DiscoveredDacBlocks',
+            description  = 'Present RF-DAC blocks, bit (4*tile+block), updated by Discover()',
+            mode         = 'RO',
+            value        = 0,
+            disp         = '{:#06x}',
+            hidden       = True,
+        ))
+
+    def _tiles(self, isAdc):
+        # (index, tile) of the constructed ADC or DAC tiles
+        enTile = self.enAdcTile if isAdc else self.enDacTile
+        return [(i, self.AdcTile[i] if isAdc else self.DacTile[i]) for i in range(4) if enTile[i]]
+
+    def _readVariables(self, variables):
+        # All the reads in flight before waiting on any of them
+        for var in variables:
+            var.parent.readBlocks(recurse=False, variable=var)
+        for var in variables:
+            var.parent.checkBlocks(recurse=False, variable=var)
+
+    def Discover(self, timeout=1.0):
+        # Reads the tile/block layout of the constructed tiles into DiscoveredAdcBlocks and
+        # DiscoveredDacBlocks and returns it (see discoveredLayout()). Nodes cannot be added
+        # or removed once the root is started: pass the layout to the next Rfdc() to build
+        # only the tiles and blocks that exist.
+        #
+        # Two phases, like UpdateIsEnabled(): each tile is gated by enableDeps on its
+        # Check*TileEnabled, so the block enables are only read once the tile enables are
+        # known and the present tiles are enabled.
+        tileChecks = [self.CheckAdcTileEnabled[i] for i in range(4)] + [self.CheckDacTileEnabled[i] for i in range(4)]
+        self._readVariables(tileChecks)
+
+        present = []
+        for isAdc in [True, False]:
+            for i, tile in self._tiles(isAdc):
+                if (self.CheckAdcTileEnabled[i] if isAdc else self.CheckDacTileEnabled[i]).value() != 0:
+                    present.append((isAdc, i, tile))
+
+        # Wait for the enableDeps of the present tiles to follow the new values
+        deadline = time.monotonic() + timeout
+        while any(tile.enable.get() is not True for _, _, tile in present) and (time.monotonic() < deadline):
+            time.sleep(0.001)
+
+        # A tile still disabled (e.g. Rfdc itself disabled) is reported with all its built blocks
+        ready = [tile for _, _, tile in present if tile.enable.get() is True]
+        blockChecks = []
+        for isAdc, i, tile in present:
+            if tile not in ready:
+                print(f'{self.path}: {tile.path} is not enabled, assuming all its blocks are present')
+            else:
+                blockChecks += [(tile.IsADCBlockEnabled if isAdc else tile.IsDACBlockEnabled)[j] for j in range(4)]
+        self._readVariables(blockChecks)
+
+        masks = [0, 0]
+        for isAdc, i, tile in present:
+            for j in range(4):
+                if not tile.enBlock[j]:
+                    continue
+                if (tile not in ready) or ((tile.IsADCBlockEnabled if isAdc else tile.IsDACBlockEnabled)[j].value() != 0):
+                    masks[0 if isAdc else 1] |= 1 << (4*i+j)
+
+        self.DiscoveredAdcBlocks.set(masks[0])
+        self.DiscoveredDacBlocks.set(masks[1])
+        return self.discoveredLayout()
+
+    def discoveredLayout(self):
+        # (ADC, DAC) block masks, bit (4*tile+block), to pass as Rfdc(layout=...)
+        return (self.DiscoveredAdcBlocks.value(), self.DiscoveredDacBlocks.value())
+
+    def ReadSnapshot(self):
+        # Status of every tile and block in one transaction, gathered by PyRFdc in one
+        # driver pass (see rfdcSnapshotDtype). Returns a NumPy structured record, e.g.
+        # snap['AdcTile'][0]['Block'][1]['SamplingFreq']
+        data = bytearray(rfsoc_utility.rfdcSnapshotDtype.itemsize)
+        self._rawRead(rfsoc_utility.RFDC_SNAPSHOT_OFFSET, numWords=len(data)//4, data=data)
+        return rfsoc_utility.decodeRfdcSnapshot(data)
+
+    def WaitAllTiles(self, target='Done', timeout=1.0, adc=True, dac=True):
+        # Waits for the IPSM of every enabled tile to reach target (see waitTileStates()).
+        # Returns True once they all have, False (listing the others) on timeout.
+        tiles = []
+        for isAdc in ([True] if adc else []) + ([False] if dac else []):
+            for i, tile in self._tiles(isAdc):
+                if (self.CheckAdcTileEnabled[i] if isAdc else self.CheckDacTileEnabled[i]).get() != 0:
+                    tiles.append(tile)
+
+        pending = rfsoc_utility.waitTileStates(tiles, target, timeout)
+        for tile in pending:
+            print( f'{tile.path}.CurrentState = {tile.CurrentState.getDisp(read=False)}, timeout waiting for {target}' )
+        return len(pending) == 0
+
+    def runAsync(self, name, arg=None, period=0.01):
+        # Starts the ...Async command (e.g. 'ResetAllAdc') and returns a concurrent.futures.Future
+        # resolved with its final AsyncState name, None if a command is already running, for example
+        #   state = rfdc.runAsync('StartUpAllAdc').result(timeout=10.0)
+        #   state = await asyncio.wrap_future(rfdc.runAsync('StartUpAllAdc'))
+        return self._startAsync(self.node(f'{name}Async'), 1 if arg is None else arg, period)
+
+    def waitAsync(self, timeout=None):
+        # Blocks until the running ...Async command finishes, returns its AsyncState name
+        # ('Busy' if the timeout expires first)
+        if self._asyncFuture is None:
+            return enumAsyncState[self.AsyncState.get()]
+        try:
+            return self._asyncFuture.result(timeout)
+        except concurrent.futures.TimeoutError:
+            return 'Busy'
+
+    def _startAsync(self, cmd, value, period=0.01):
+        if (self._asyncFuture is not None) and not self._asyncFuture.done():
+            print( f'{self.path}: {cmd.name} not started, an async command is already running' )
+            return None
+
+        # Pause the polling of the Rfdc registers, PyRFdc only serves AsyncState meanwhile
+        paused = [(var, var.pollInterval) for var in self.variableList if (var.pollInterval > 0) and (var is not self.AsyncState)]
+        for var, _ in paused:
+            var.setPollInterval(0)
+
+        def resume():
+            for var, interval in paused:
+                var.setPollInterval(interval)
+
+        future = concurrent.futures.Future()
+        try:
+            cmd.set(value)
+        except Exception:
+            resume()
+            raise
+
+        def run():
+            try:
+                state = enumAsyncState[self.AsyncState.get()]
+                while state == 'Busy':
+                    time.sleep(period)
+                    state = enumAsyncState[self.AsyncState.get()]
+            except Exception as e:
+                print( f'{self.path}: {cmd.name}: {e}' )
+                state = 'Error'
+            resume()
+            future.set_result(state)
+
+        self._asyncFuture = future
+        threading.Thread(target=run, name=f'{self.path}.{cmd.name}', daemon=True).start()
+        return future
+
     def UpdateIsEnabled(self):
         # Reset ADC Tiles
         for i in range(4):
             if self.enAdcTile[i] and (self.CheckAdcTileEnabled[i].get() != 0):
                 for j in range(4):
                     self.AdcTile[i].IsADCBlockEnabled[j].get() # Update shadow variable
+                    if not self.enAdcBlock[i][j]:
+                        continue
                     self.AdcTile[i].AdcBlock[j].BlockStatus.MixerMode.get() # Update shadow variable
                     self.AdcTile[i].AdcBlock[j].BlockStatus.SampleRate.get() # Update shadow variable
                     self.AdcTile[i].AdcBlock[j].IsMixerEnabled.get() # Update shadow variable
@@ -655,6 +898,8 @@ class Rfdc(pr.Device):
             if self.enDacTile[i] and (self.CheckDacTileEnabled[i].get() != 0):
                 for j in range(4):
                     self.DacTile[i].IsDACBlockEnabled[j].get() # Update shadow variable
+                    if not self.enDacBlock[i][j]:
+                        continue
                     self.DacTile[i].DacBlock[j].BlockStatus.MixerMode.get() # Update shadow variable
                     self.DacTile[i].DacBlock[j].BlockStatus.SampleRate.get() # Update shadow variable
                     self.DacTile[i].DacBlock[j].IsMixerEnabled.get() # Update shadow variable
@@ -0,0 +1,63 @@
+#-----------------------------------------------------------------------------
+# Title      : Xilinx RFSoC RF data converter register tables
+#-----------------------------------------------------------------------------
+# Description: Table-driven construction of the RfdcTile/RfdcBlock registers
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import pyrogue as pr
+
+# One register (or sub-device) of an RFDC tile/block.
+#   node: pr.RemoteVariable, pr.RemoteCommand or an RfdcRegisterDevice subclass
+#         (kwargs with 'number' are added with Device.addRemoteVariables)
+#   adc:  present in ADC tiles/blocks
+#   dac:  present in DAC tiles/blocks
+#   gen3: None for all generations, True for Gen 3/DFE only, False for Gen 1/2 only
+class RfdcRegister(object):
+    def __init__(self, node, adc=True, dac=True, gen3=None, **kwargs):
+        self.node   = node
+        self.adc    = adc
+        self.dac    = dac
+        self.gen3   = gen3
+        self.kwargs = kwargs
+
+    def present(self, isAdc, gen3):
+        return (self.adc if isAdc else self.dac) and ((self.gen3 is None) or (self.gen3 == bool(gen3)))
+
+# Ordered list of RfdcRegister, defined once at module level.
+# The entries present for a given (isAdc, gen3) layout are resolved on first use and
+# cached, so each tile/block only instantiates the nodes it needs.
+class RfdcRegisterTable(object):
+    def __init__(self, *registers):
+        self._registers = registers
+        self._layouts   = {}
+
+    def layout(self, isAdc, gen3):
+        key = (bool(isAdc), bool(gen3))
+        if key not in self._layouts:
+            self._layouts[key] = tuple(reg for reg in self._registers if reg.present(*key))
+        return self._layouts[key]
+
+    def build(self, dev, isAdc, gen3):
+        for reg in self.layout(isAdc, gen3):
+            if 'number' in reg.kwargs:
+                dev.addRemoteVariables(**reg.kwargs)
+            elif issubclass(reg.node, RfdcRegisterDevice):
+                dev.add(reg.node(isAdc=isAdc, gen3=gen3, **reg.kwargs))
+            else:
+                dev.add(reg.node(**reg.kwargs))
+
+# Device whose registers come from the 'registers' class attribute
+class RfdcRegisterDevice(pr.Device):
+    registers = RfdcRegisterTable()
+
+    def __init__(self, isAdc=False, gen3=True, **kwargs):
+        super().__init__(**kwargs)
+        self.registers.build(self, isAdc, gen3)
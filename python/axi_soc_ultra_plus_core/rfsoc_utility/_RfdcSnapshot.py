@@ -0,0 +1,59 @@
+#-----------------------------------------------------------------------------
+# Title      : Xilinx RFSoC RF data converter status snapshot
+#-----------------------------------------------------------------------------
+# Description: Record layout of the PyRFdc status snapshot window
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+# Must match SNAPSHOT_ADDR/SNAPSHOT_VERSION in PyRFdc.h
+RFDC_SNAPSHOT_OFFSET  = 0x14000
+RFDC_SNAPSHOT_VERSION = 1
+
+# https://docs.amd.com/r/en-US/pg269-rf-data-converter/struct-XRFdc_BlockStatus
+rfdcBlockSnapshotDtype = np.dtype([
+    ('SamplingFreq',          '<f8'),
+    ('AnalogDataPathStatus',  '<u4'),
+    ('DigitalDataPathStatus', '<u4'),
+    ('DataPathClocksStatus',  '<u4'),
+    ('IsFIFOFlagsEnabled',    '<u4'),
+    ('IsFIFOFlagsAsserted',   '<u4'),
+    ('IsEnabled',             '<u4'), # 0 if the block is absent (all the fields are zero)
+])
+
+# https://docs.amd.com/r/en-US/pg269-rf-data-converter/struct-XRFdc_TileStatus
+rfdcTileSnapshotDtype = np.dtype([
+    ('IsEnabled',       '<u4'), # 0 if the tile is absent (all the fields are zero)
+    ('TileState',       '<u4'),
+    ('BlockStatusMask', '<u4'),
+    ('PowerUpState',    '<u4'),
+    ('PLLState',        '<u4'),
+    ('PLLLockStatus',   '<u4'), # XRFdc_GetPLLLockStatus() value (1: unlocked, 2: locked)
+    ('CurrentState',    '<u4'), # Current State Register (0x000C)
+    ('CommonStatus',    '<u4'), # Tile Common Status Register (0x0228)
+    ('Block',           rfdcBlockSnapshotDtype, (4,)),
+])
+
+rfdcSnapshotDtype = np.dtype([
+    ('Version', '<u4'),
+    ('Count',   '<u4'), # Incremented on every capture
+    ('Size',    '<u4'), # Bytes
+    ('Errors',  '<u4'), # Failed driver calls during the capture
+    ('AdcTile', rfdcTileSnapshotDtype, (4,)),
+    ('DacTile', rfdcTileSnapshotDtype, (4,)),
+])
+
+def decodeRfdcSnapshot(data):
+    # Structured record from the raw snapshot bytes
+    snap = np.frombuffer(data, dtype=rfdcSnapshotDtype, count=1)[0]
+    if (snap['Version'] != RFDC_SNAPSHOT_VERSION) or (snap['Size'] != rfdcSnapshotDtype.itemsize):
+        raise ValueError(f'Unsupported RFDC snapshot (version={snap["Version"]}, size={snap["Size"]}), PyRFdc and rfsoc_utility are out of sync')
+    return snap
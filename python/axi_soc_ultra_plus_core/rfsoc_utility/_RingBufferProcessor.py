@@ -11,6 +11,10 @@
 import rogue.interfaces.stream as ris
 import pyrogue as pr
 import numpy as np
+import collections
+import threading
+
+import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
 
 import rogue
 rogue.Version.minVersion('6.2.0')
@@ -21,8 +25,19 @@ class RingBufferProcessor(pr.DataReceiver):
     def __init__( self,
             maxSize     = 2**14,
             sampleRate  = 5.0E+9, # Units of Hz
-            maxAve      = 4,
+            maxAve      = 256,
+            defaultAve  = 4,
+            aveMode     = 'Running', # See rfsoc_utility.enumFftAveragingMode
+            aveDomain   = 'dB',      # See rfsoc_utility.enumFftAveragingDomain
+            window      = 'Rectangular', # See rfsoc_utility.enumFftWindow
             liveDisplay = True,
+            metrics     = False, # True to compute SNR/SFDR/SINAD/ENOB/THD from the averaged spectrum
+            dispPoints  = 0,     # Number of points in the decimated display variables (0 to disable)
+            serveFull   = False, # With dispPoints > 0: True to keep serving the full WaveformData/Magnitude
+            zeroCopy    = False, # True to read frames straight into reusable buffers, bypassing the Data variable
+            asyncMode   = False, # True to compute the spectra in a worker thread instead of the stream thread
+            queueDepth  = 4,
+            dropPolicy  = 'NewestWins', # See rfsoc_utility.enumDropPolicy
             hidden      = True,
             **kwargs):
         pr.Device.__init__(self, hidden=hidden, **kwargs)
@@ -30,6 +45,7 @@ class RingBufferProcessor(pr.DataReceiver):
         pr.DataReceiver.__init__(self, enableOnStart=True, hideData=True, hidden=hidden, **kwargs)
 
         self._liveDisplay = liveDisplay
+        self._metrics     = metrics and liveDisplay
 
         # Not saving config/state to YAML
         guiGroups = ['NoStream','NoState','NoConfig']
@@ -47,8 +63,35 @@ class RingBufferProcessor(pr.DataReceiver):
         # Init variables
         self._freqBin  = ((0.5E+3/self._timeBin)/float(self._maxSize>>1)) # Units of MHz
         self._adcLsb   = 500.0/float(2**15) # units of mV
-        self._idx      = 0
-        self._aveSize  = 1
+        self._engine   = rfsoc_utility.SpectralEngine(window=window)
+        self._aveLock  = threading.Lock()
+
+        # Optional worker thread with a bounded queue of preallocated frame buffers
+        if asyncMode:
+            self._workQueue = rfsoc_utility.FrameWorkQueue(
+                handler = self._processQueued,
+                release = self._releaseBuffer,
+                depth   = queueDepth,
+                policy  = dropPolicy,
+                name    = f'{self.name}.FrameWorkQueue',
+            )
+            self._bufPool = collections.deque(
+                np.zeros(shape=self._maxSize, dtype=np.int16, order='C') for _ in range(queueDepth+2)
+            )
+        else:
+            self._workQueue = None
+
+        # Zero-copy mode reads every frame into the same receive buffer, the spectra are
+        # computed from it and only the published WaveformData is a copy (the listeners,
+        # update thread and remote clients keep a reference to the published array)
+        self._zeroCopy = zeroCopy
+        self._rxBuf    = np.zeros(shape=self._maxSize, dtype=np.int16, order='C')
+
+        # Optional decimated copies of WaveformData/Magnitude for remote displays
+        self._dispEnable = (dispPoints > 0)
+        if self._dispEnable:
+            self._timeDec = rfsoc_utility.DisplayDecimator(self._maxSize, dispPoints, mode='MinMax')
+            self._freqDec = rfsoc_utility.DisplayDecimator(self._maxSize>>1, dispPoints, mode='Peak')
 
         # Calculate the time/frequency x-axis arrays
         timeSteps = np.linspace(0, self._timeBin*(self._maxSize-1), num=self._maxSize)
@@ -98,13 +141,48 @@ class RingBufferProcessor(pr.DataReceiver):
                 localSet    = self._fftAveraging,
                 mode        = 'RW',
                 typeStr     = 'UInt12',
-                value       = self._maxAve,
+                value       = min(defaultAve,self._maxAve),
                 minimum     = 1,
                 maximum     = self._maxAve,
                 groups      = guiGroups,
             ))
 
-            self._mag = np.zeros(shape=[self._maxAve,(self._maxSize>>1)], dtype=np.float32, order='C')
+            self.add(pr.LocalVariable(
+                name        = 'FftAveragingMode',
+                description = 'Running: boxcar average of the last FftAveraging spectra, Exponential: moving average with alpha=1/FftAveraging',
+                localSet    = self._fftAveragingMode,
+                mode        = 'RW',
+                value       = list(rfsoc_utility.enumFftAveragingMode.values()).index(aveMode),
+                enum        = rfsoc_utility.enumFftAveragingMode,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = 'FftAveragingDomain',
+                description = 'dB: average the dBFS values, Power: average the linear power then convert to dBFS',
+                localSet    = self._fftAveragingDomain,
+                mode        = 'RW',
+                value       = list(rfsoc_utility.enumFftAveragingDomain.values()).index(aveDomain),
+                enum        = rfsoc_utility.enumFftAveragingDomain,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = 'FftWindow',
+                description = 'Window function applied before the FFT',
+                localSet    = self._fftWindow,
+                mode        = 'RW',
+                value       = list(rfsoc_utility.enumFftWindow.values()).index(window),
+                enum        = rfsoc_utility.enumFftWindow,
+                groups      = guiGroups,
+            ))
+
+            self._averager = rfsoc_utility.SpectrumAverager(
+                shape  = (self._maxSize>>1,),
+                depth  = min(defaultAve,self._maxAve),
+                mode   = aveMode,
+                domain = aveDomain,
+            )
 
         self.add(pr.LocalVariable(
             name   = 'NewDataReady',
@@ -112,65 +190,277 @@ class RingBufferProcessor(pr.DataReceiver):
             groups = guiGroups,
         ))
 
+        if self._dispEnable:
+
+            self.add(pr.LocalVariable(
+                name        = 'DisplayPoints',
+                description = 'Number of points in the decimated display variables',
+                localSet    = self._displayPoints,
+                mode        = 'RW',
+                typeStr     = 'UInt32',
+                value       = dispPoints,
+                minimum     = 2,
+                maximum     = self._maxSize,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = 'TimeDisplay',
+                description = 'Time steps of WaveformDisplay (ns)',
+                typeStr     = 'Float[np]',
+                value       = self._timeDec.axis(timeSteps),
+                hidden      = True,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = 'WaveformDisplay',
+                description = 'Min/max envelope of WaveformData',
+                typeStr     = 'Int16[np]',
+                value       = self._timeDec.decimate(np.zeros(shape=self._maxSize, dtype=np.int16, order='C')),
+                hidden      = True,
+                groups      = guiGroups,
+            ))
+
+            if (self._liveDisplay):
+
+                self.add(pr.LocalVariable(
+                    name        = 'FreqDisplay',
+                    description = 'Freq steps of MagnitudeDisplay (MHz)',
+                    typeStr     = 'Float[np]',
+                    value       = self._freqDec.axis(freqSteps),
+                    hidden      = True,
+                    groups      = guiGroups,
+                ))
+
+                self.add(pr.LocalVariable(
+                    name        = 'MagnitudeDisplay',
+                    description = 'Peak preserving decimation of Magnitude',
+                    typeStr     = 'Float[np]',
+                    value       = self._freqDec.decimate(np.zeros(shape=(self._maxSize>>1), dtype=np.float32, order='C')),
+                    hidden      = True,
+                    groups      = guiGroups,
+                ))
+
+            # Remote clients only get the decimated variables
+            if not serveFull:
+                self.WaveformData.addToGroup('NoServe')
+                if (self._liveDisplay):
+                    self.Magnitude.addToGroup('NoServe')
+
+        if self._metrics:
+
+            self.add(pr.LocalVariable(
+                name        = 'NumHarmonics',
+                description = 'Number of harmonics (starting at the 2nd) counted as distortion',
+                mode        = 'RW',
+                typeStr     = 'UInt8',
+                value       = 5,
+                minimum     = 1,
+                maximum     = 16,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name        = 'FundamentalFreq',
+                description = 'Frequency of the largest non-DC bin',
+                mode        = 'RO',
+                value       = 0.0,
+                units       = 'MHz',
+                disp        = '{:.3f}',
+                groups      = guiGroups,
+            ))
+
+            for name, _, units, desc in rfsoc_utility.spectralMetricVariables:
+                self.add(pr.LocalVariable(
+                    name        = name,
+                    description = desc,
+                    mode        = 'RO',
+                    value       = 0.0,
+                    units       = units,
+                    disp        = '{:.2f}',
+                    groups      = guiGroups,
+                ))
+
+        if asyncMode:
+
+            self.add(pr.LocalVariable(
+                name        = 'DropPolicy',
+                description = 'Action when the worker queue is full',
+                localSet    = self._dropPolicy,
+                mode        = 'RW',
+                value       = list(rfsoc_utility.enumDropPolicy.values()).index(dropPolicy),
+                enum        = rfsoc_utility.enumDropPolicy,
+                groups      = guiGroups,
+            ))
+
+            self.add(pr.LocalVariable(
+                name         = 'FramesAccepted',
+                description  = 'Number of frames accepted into the worker queue',
+                mode         = 'RO',
+                value        = 0,
+                localGet     = lambda: self._workQueue.accepted,
+                pollInterval = 1,
+            ))
+
+            self.add(pr.LocalVariable(
+                name         = 'FramesDropped',
+                description  = 'Number of frames dropped by the worker queue',
+                mode         = 'RO',
+                value        = 0,
+                localGet     = lambda: self._workQueue.dropped,
+                pollInterval = 1,
+            ))
+
+            self.add(pr.LocalVariable(
+                name         = 'FramesProcessed',
+                description  = 'Number of frames processed by the worker thread',
+                mode         = 'RO',
+                value        = 0,
+                localGet     = lambda: self._workQueue.processed,
+                pollInterval = 1,
+            ))
+
     def _start(self):
         super()._start()
         if self._liveDisplay:
             self.RxEnable.set(value=False) # blow off data by default
         else:
             self.RxEnable.set(value=True)
+        if self._workQueue is not None:
+            self._workQueue.start()
+
+    def _stop(self):
+        if self._workQueue is not None:
+            self._workQueue.stop()
+        super()._stop()
+
+    def countReset(self):
+        super().countReset()
+        if self._workQueue is not None:
+            self._workQueue.countReset()
+
+    def _dropPolicy(self,value,changed):
+        if changed:
+            self._workQueue.policy = rfsoc_utility.enumDropPolicy[value]
+
+    def _displayPoints(self,value,changed):
+        if changed:
+            self._timeDec = rfsoc_utility.DisplayDecimator(self._maxSize, int(value), mode='MinMax')
+            self.TimeDisplay.set(self._timeDec.axis(self.Time.value()))
+            if (self._liveDisplay):
+                self._freqDec = rfsoc_utility.DisplayDecimator(self._maxSize>>1, int(value), mode='Peak')
+                self.FreqDisplay.set(self._freqDec.axis(self.Freq.value()))
+
+    def _releaseBuffer(self,buf):
+        self._bufPool.append(buf)
 
     def _fftAveraging(self,value,changed):
         if changed:
-            self.FftAveraging.set(int(value))
+            with self._aveLock:
+                self._averager.configure(depth=int(value))
+
+    def _fftAveragingMode(self,value,changed):
+        if changed:
+            with self._aveLock:
+                self._averager.configure(mode=rfsoc_utility.enumFftAveragingMode[value])
+
+    def _fftAveragingDomain(self,value,changed):
+        if changed:
+            with self._aveLock:
+                self._averager.configure(domain=rfsoc_utility.enumFftAveragingDomain[value])
+
+    def _fftWindow(self,value,changed):
+        if changed:
+            self._engine.window = rfsoc_utility.enumFftWindow[value]
             self.rstFftAveraging()
 
     def rstFftAveraging(self):
-        self._idx     = 0
-        self._aveSize = 1
+        with self._aveLock:
+            self._averager.reset()
 
-    def running_mean(self,x):
-        # Calculate running average
-        retVar = np.sum(x[:self._aveSize], axis=0, dtype=np.float32)/float(self._aveSize)
+    # Publish the waveform and its averaged spectrum (caller holds the update group).
+    # copy=True if waveformData is a reused buffer
+    def _publish(self,waveformData,copy=False):
+        self.WaveformData.set(waveformData.copy() if copy else waveformData,write=True)
+        if self._dispEnable:
+            self.WaveformDisplay.set(self._timeDec.decimate(waveformData),write=True)
 
-        # Increment counters
-        if (self._idx == self.FftAveraging.get()-1):
-            self._idx = 0
-        else:
-            self._idx += 1
-        if (self._aveSize != self.FftAveraging.get()):
-            self._aveSize += 1
+        # Check if live display
+        if (self._liveDisplay):
 
-        # Return the results
-        return retVar
+            # Calculate the windowed real FFT power spectrum
+            power = self._engine.power(waveformData)
 
-    # Method which is called when a frame is received
-    def process(self,frame):
+            # Calculate the average magnitude (units of dBFS)
+            with self._aveLock:
+                magnitude = self._averager.update(power)
+            self.Magnitude.set(magnitude.copy(),write=True)
+            if self._dispEnable:
+                self.MagnitudeDisplay.set(self._freqDec.decimate(magnitude),write=True)
+
+            # Calculate the converter figures of merit from the averaged spectrum
+            if self._metrics:
+                self._updateMetrics(magnitude)
+
+        self.NewDataReady.set(True)
+
+    def _updateMetrics(self,magnitude):
+        metrics = rfsoc_utility.spectralMetrics(
+            power        = np.power(10.0, 0.1*magnitude.astype(np.float64)),
+            window       = self._engine.window,
+            numHarmonics = self.NumHarmonics.value(),
+        )
+        self.FundamentalFreq.set(float(metrics['fundamentalBin'])*self._freqBin)
+        for name, key, _, _ in rfsoc_utility.spectralMetricVariables:
+            self.node(name).set(float(metrics[key]))
+
+    # Method which is called by the worker thread for each queued frame
+    def _processQueued(self,buf):
         with self.root.updateGroup():
-            pr.DataReceiver.process(self,frame)
+            # buf is recycled once this returns
+            self._publish(buf,copy=True)
 
-            # Check frame size
-            if (frame.getPayload()//2) != self._maxSize:
-                print( f'{self.path}: Invalid frame size.  Got {frame.getPayload()//2}, expected {self._maxSize}' )
-            else:
-                # Get data from frame
-                waveformData = self.Data.value()[:].view(np.int16)
-                self.WaveformData.set(waveformData,write=True)
+    # Frame/byte/error accounting of pr.DataReceiver.process() for the paths that bypass it.
+    # Returns False for an errored frame, which is dropped like in pr.DataReceiver.process()
+    def _countFrame(self,frame):
+        self.FrameCount.set(self.FrameCount.value()+1)
+        self.ByteCount.set(self.ByteCount.value()+frame.getPayload())
+        if frame.getError() != 0:
+            self.ErrorCount.set(self.ErrorCount.value()+1)
+            return False
+        return True
 
-                # Check if live display
-                if (self._liveDisplay):
+    def _checkSize(self,frame):
+        if (frame.getPayload()//2) != self._maxSize:
+            print( f'{self.path}: Invalid frame size.  Got {frame.getPayload()//2}, expected {self._maxSize}' )
+            return False
+        return True
 
-                    # Calculate the FFT
-                    freq = np.fft.fft(waveformData)/float(len(waveformData))
-                    freq = freq[range(len(waveformData)//2)]
+    # Method which is called when a frame is received
+    def process(self,frame):
+        # Check for worker thread mode
+        if self._workQueue is not None:
+            if self._countFrame(frame) and self._checkSize(frame):
+                # Only copy the frame in the stream thread: the spectra are computed in the worker thread
+                buf = self._bufPool.popleft() if self._bufPool else np.zeros(shape=self._maxSize, dtype=np.int16, order='C')
+                frame.read(buf.view(np.uint8),0)
+                self._workQueue.put(buf)
+            return
 
-                    # Prevent warning message when for divide by zero encountered in log10
-                    # Checking for inf later to fix this in the display
-                    np.seterr(divide = 'ignore')
+        # Check for zero-copy mode
+        if self._zeroCopy:
+            with self.root.updateGroup():
+                if self._countFrame(frame) and self._checkSize(frame):
+                    # Read the frame into the receive buffer, the only copy is the published one
+                    frame.read(self._rxBuf.view(np.uint8),0)
+                    self._publish(self._rxBuf,copy=True)
+            return
 
-                    # Calculate the average magnitude
-                    mag = 20.0*np.log10(np.abs(freq)/32767.0) # Units of dBFS
-                    self._mag[self._idx] = mag
-                    magnitude = self.running_mean(self._mag)
-                    self.Magnitude.set(magnitude,write=True)
+        with self.root.updateGroup():
+            pr.DataReceiver.process(self,frame)
 
-                self.NewDataReady.set(True)
+            # Check frame size
+            if self._checkSize(frame):
+                # Get data from frame
+                self._publish(self.Data.value()[:].view(np.int16))
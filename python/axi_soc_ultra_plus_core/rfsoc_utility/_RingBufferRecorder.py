@@ -0,0 +1,352 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import rogue.interfaces.stream as ris
+import pyrogue as pr
+import numpy as np
+
+import datetime
+import io
+import os
+import threading
+import time
+
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+enumCaptureFormat = {
+    0 : 'Npy',  # Memory-mapped structured .npy file
+    1 : 'Hdf5', # Chunked HDF5 datasets (requires h5py)
+}
+
+def captureDtype(maxSize):
+    # One record per frame
+    return np.dtype([
+        ('timestamp', '<f8'),           # Host receive time (seconds since epoch)
+        ('channel',   '<u2'),           # Ring buffer channel
+        ('error',     '<u2'),           # Rogue frame error flags
+        ('size',      '<u4'),           # Number of valid int16 samples in 'data'
+        ('data',      '<i2', (maxSize,)),
+    ])
+
+# Preallocated memory-mapped .npy capture file
+class NpyCaptureFile(object):
+    suffix = '.npy'
+
+    def __init__(self, path, dtype, capacity):
+        self.path     = path
+        self.capacity = capacity
+        self.count    = 0
+        self._dtype   = dtype
+        self._mm      = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(capacity,))
+
+    def record(self):
+        # Next free record, a view into the memory map
+        rec = self._mm[self.count]
+        self.count += 1
+        return rec
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        offset = self._mm.offset
+        self._mm.flush()
+        del self._mm
+
+        # Shrink the header shape to the number of records written and drop the unused tail.
+        # numpy pads the header so that the new one has the same length in all but very old versions.
+        if self.count < self.capacity:
+            hdr = io.BytesIO()
+            np.lib.format.write_array_header_1_0(hdr, {
+                'descr'         : np.lib.format.dtype_to_descr(self._dtype),
+                'fortran_order' : False,
+                'shape'         : (self.count,),
+            })
+            if len(hdr.getvalue()) == offset:
+                with open(self.path, 'r+b') as f:
+                    f.write(hdr.getvalue())
+                    f.truncate(offset + self.count*self._dtype.itemsize)
+
+# Preallocated chunked HDF5 capture file, filled through an in-memory staging chunk
+class Hdf5CaptureFile(object):
+    suffix = '.h5'
+
+    def __init__(self, path, dtype, capacity, chunkSize=64):
+        if h5py is None:
+            raise ImportError('h5py is required for HDF5 capture files')
+        self.path     = path
+        self.capacity = capacity
+        self.count    = 0
+        self._stage   = np.zeros(chunkSize, dtype=dtype)
+        self._staged  = 0
+        self._file    = h5py.File(path, 'w')
+        self._dsets   = {}
+        for name in dtype.names:
+            sub = dtype[name]
+            shape = (capacity,) + sub.shape
+            self._dsets[name] = self._file.create_dataset(
+                name,
+                shape   = shape,
+                maxshape= shape,
+                dtype   = sub.base,
+                chunks  = (chunkSize,) + sub.shape,
+            )
+
+    def record(self):
+        if self._staged == len(self._stage):
+            self._writeStage()
+        rec = self._stage[self._staged]
+        self._staged += 1
+        self.count   += 1
+        return rec
+
+    def _writeStage(self):
+        if self._staged > 0:
+            start = self.count - self._staged
+            for name, dset in self._dsets.items():
+                dset[start:self.count] = self._stage[name][:self._staged]
+            self._staged = 0
+
+    def flush(self):
+        self._writeStage()
+        self._file.flush()
+
+    def close(self):
+        self._writeStage()
+        for dset in self._dsets.values():
+            dset.resize(self.count, axis=0)
+        self._file.close()
+
+# Stream slave for a single channel of the RingBufferRecorder
+class RingBufferRecorderPort(ris.Slave):
+    def __init__(self, parent, ch):
+        ris.Slave.__init__(self)
+        self._parent = parent
+        self._ch     = ch
+
+    def _acceptFrame(self, frame):
+        self._parent._record(self._ch, frame)
+
+# Records ring buffer frames with timestamps and channel IDs into preallocated capture files
+class RingBufferRecorder(pr.Device, ris.Slave):
+    def __init__( self,
+            numCh         = 1,
+            maxSize       = 2**14,  # Number of int16 samples per record
+            fileFormat    = 'Npy',  # See rfsoc_utility.enumCaptureFormat
+            framesPerFile = 4096,   # Records preallocated in each file before rotating
+            flushPeriod   = 1.0,    # Units of seconds
+            **kwargs):
+        pr.Device.__init__(self, **kwargs)
+        ris.Slave.__init__(self)
+
+        self._maxSize = maxSize
+        self._dtype   = captureDtype(maxSize)
+        self._file    = None
+        self._lock    = threading.Lock()
+        self._ports   = [RingBufferRecorderPort(self,i) for i in range(numCh)]
+        self._flushThread = None
+        self._flushPeriod = flushPeriod
+        self._flushEvent  = threading.Event()
+
+        self.add(pr.LocalVariable(
+            name        = 'DataDirectory',
+            description = 'Directory where the capture files are created',
+            mode        = 'RW',
+            value       = '',
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FilePrefix',
+            description = 'Prefix of the capture file names',
+            mode        = 'RW',
+            value       = 'capture',
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FileFormat',
+            description = 'Capture file format',
+            mode        = 'RW',
+            value       = list(enumCaptureFormat.values()).index(fileFormat),
+            enum        = enumCaptureFormat,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FramesPerFile',
+            description = 'Number of records preallocated per file, a new file is opened when full',
+            mode        = 'RW',
+            typeStr     = 'UInt32',
+            value       = framesPerFile,
+            minimum     = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'MaxTotalSize',
+            description = 'Recording stops once this many bytes have been recorded (0 for no limit)',
+            mode        = 'RW',
+            typeStr     = 'UInt64',
+            value       = 0,
+            units       = 'Bytes',
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'IsOpen',
+            description = 'Recording is active',
+            mode        = 'RO',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'CurrentFile',
+            description = 'Capture file being written',
+            mode        = 'RO',
+            value       = '',
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'FileCount',
+            description  = 'Number of capture files opened since Open',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'FrameCount',
+            description  = 'Number of frames recorded since Open',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'DropCount',
+            description  = 'Number of frames not recorded (closed, larger than maxSize or size cap reached)',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'TotalSize',
+            description  = 'Number of bytes recorded since Open',
+            mode         = 'RO',
+            typeStr      = 'UInt64',
+            value        = 0,
+            units        = 'Bytes',
+            pollInterval = 1,
+        ))
+
+        @self.command(description='Start recording into a new set of capture files')
+        def Open():
+            with self._lock:
+                self._closeFile()
+                self._stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+                self.FileCount.set(0)
+                self.FrameCount.set(0)
+                self.DropCount.set(0)
+                self.TotalSize.set(0)
+                self._openFile()
+            self.IsOpen.set(True)
+
+        @self.command(description='Stop recording and close the capture file')
+        def Close():
+            self.IsOpen.set(False)
+            with self._lock:
+                self._closeFile()
+
+    def port(self, ch):
+        # Stream slave to connect AppRingBufferEngine.Ch[ch] to
+        return self._ports[ch]
+
+    def _start(self):
+        super()._start()
+        self._flushEvent.clear()
+        self._flushThread = threading.Thread(target=self._flushWorker, name=f'{self.name}.Flush', daemon=True)
+        self._flushThread.start()
+
+    def _stop(self):
+        self._flushEvent.set()
+        if self._flushThread is not None:
+            self._flushThread.join()
+            self._flushThread = None
+        self.Close()
+        super()._stop()
+
+    def _openFile(self):
+        fmt  = enumCaptureFormat[self.FileFormat.value()]
+        cls  = NpyCaptureFile if fmt == 'Npy' else Hdf5CaptureFile
+        path = os.path.join(
+            self.DataDirectory.value(),
+            f'{self.FilePrefix.value()}_{self._stamp}_{self.FileCount.value():04d}{cls.suffix}',
+        )
+        self._file = cls(path, self._dtype, self.FramesPerFile.value())
+        self.FileCount += 1
+        self.CurrentFile.set(path)
+
+    def _closeFile(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flushWorker(self):
+        # Background msync()/HDF5 flush so the stream threads only do memory copies
+        while not self._flushEvent.wait(self._flushPeriod):
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+
+    # Frames connected directly to the device use the Rogue frame channel as the channel ID
+    def _acceptFrame(self, frame):
+        self._record(frame.getChannel(), frame)
+
+    def _record(self, ch, frame):
+        timestamp = time.time()
+
+        if self.IsOpen.value() is False:
+            return
+
+        with frame.lock(), self._lock:
+            if self._file is None:
+                self.DropCount += 1
+                return
+
+            # Records hold at most maxSize samples, a larger frame is dropped rather than truncated
+            size = frame.getPayload()//2
+            if size > self._maxSize:
+                self.DropCount += 1
+                return
+
+            # Check the size cap
+            maxTotal = self.MaxTotalSize.value()
+            if (maxTotal > 0) and (self.TotalSize.value()+self._dtype.itemsize > maxTotal):
+                print( f'{self.path}: MaxTotalSize reached, recording stopped' )
+                self.DropCount += 1
+                self._closeFile()
+                self.IsOpen.set(False)
+                return
+
+            # Rotate to the next file
+            if self._file.count == self._file.capacity:
+                self._closeFile()
+                self._openFile()
+
+            # Fill the next record, the frame payload is read straight into the file
+            rec  = self._file.record()
+            rec['timestamp'] = timestamp
+            rec['channel']   = ch
+            rec['error']     = frame.getError()
+            rec['size']      = size
+            frame.read(rec['data'].view(np.uint8)[:2*size],0)
+
+            self.FrameCount += 1
+            self.TotalSize  += self._dtype.itemsize
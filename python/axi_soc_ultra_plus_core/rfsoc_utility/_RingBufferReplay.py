@@ -0,0 +1,198 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import rogue.interfaces.stream as ris
+import pyrogue as pr
+import numpy as np
+
+import threading
+import time
+
+# Stream master for a single channel of the RingBufferReplay
+class RingBufferReplayPort(ris.Master):
+    def __init__(self, ch):
+        ris.Master.__init__(self)
+        self._ch = ch
+
+    def send(self, data, error=0):
+        # data: int16 samples of one frame
+        raw   = np.ascontiguousarray(data, dtype=np.int16).view(np.uint8)
+        frame = self._reqFrame(len(raw), True)
+        frame.write(raw, 0)
+        frame.setChannel(self._ch)
+        frame.setError(error)
+        self._sendFrame(frame)
+
+# Streams recorded ring buffer frames from disk as Rogue frames
+#
+# Supported files (opened with mmap_mode='r', so only the frames being sent are paged in):
+#   - RingBufferRecorder .npy captures: each record goes to port(record['channel'])
+#   - int16 .npy arrays of shape [frames, N]: every frame goes to all ports
+#   - int16 .npy arrays of shape [frames, numCh, N]: row i goes to port(i)
+class RingBufferReplay(pr.Device):
+    def __init__( self,
+            numCh = 1,
+            rate  = 0.0, # Units of frames/s, 0 for as fast as possible
+            **kwargs):
+        super().__init__(**kwargs)
+
+        self._ports  = [RingBufferReplayPort(i) for i in range(numCh)]
+        self._data   = None
+        self._thread = None
+        self._run    = threading.Event()
+
+        self.add(pr.LocalVariable(
+            name        = 'FilePath',
+            description = 'Recorded .npy file to replay',
+            mode        = 'RW',
+            value       = '',
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Rate',
+            description = 'Replay rate (0 for as fast as possible)',
+            mode        = 'RW',
+            value       = float(rate),
+            units       = 'frames/s',
+            minimum     = 0.0,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Loop',
+            description = 'Restart from the first frame at the end of the file',
+            mode        = 'RW',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Running',
+            description = 'Replay is active',
+            mode        = 'RO',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FileFrames',
+            description = 'Number of frames in the file',
+            mode        = 'RO',
+            value       = 0,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'FrameCount',
+            description  = 'Number of frames sent since StartReplay',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'AchievedRate',
+            description  = 'Measured frame rate of the last or current replay',
+            mode         = 'RO',
+            value        = 0.0,
+            units        = 'frames/s',
+            disp         = '{:.1f}',
+            pollInterval = 1,
+        ))
+
+        @self.command(description='Open FilePath and start streaming')
+        def StartReplay():
+            self.StopReplay()
+            self.load(self.FilePath.value())
+            self._run.set()
+            self._thread = threading.Thread(target=self.replay, name=f'{self.name}.Replay', daemon=True)
+            self._thread.start()
+
+        @self.command(description='Stop streaming')
+        def StopReplay():
+            self._run.clear()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+    def port(self, ch):
+        # Stream master to connect to RingBufferProcessor or MultiChannelRingBufferProcessor.port(ch)
+        return self._ports[ch]
+
+    def _stop(self):
+        self.StopReplay()
+        super()._stop()
+
+    def load(self, path):
+        self._data = np.load(path, mmap_mode='r')
+        if (self._data.dtype.names is None) and (self._data.ndim not in [2,3]):
+            raise ValueError(f'{path}: expected a capture file or an array of shape [frames, N] or [frames, numCh, N]')
+        self.FileFrames.set(len(self._data))
+
+    def _sendIndex(self, idx):
+        rec = self._data[idx]
+
+        # Recorder capture
+        if self._data.dtype.names is not None:
+            ch = int(rec['channel'])
+            if ch < len(self._ports):
+                self._ports[ch].send(rec['data'][:int(rec['size'])], int(rec['error']))
+
+        # [frames, numCh, N]
+        elif self._data.ndim == 3:
+            for ch in range(min(len(self._ports), rec.shape[0])):
+                self._ports[ch].send(rec[ch])
+
+        # [frames, N]
+        else:
+            for port in self._ports:
+                port.send(rec)
+
+    def replay(self, count=None):
+        # Streams 'count' frames (wrapping around the file as needed) or, by default,
+        # the whole file (forever if Loop) and returns the achieved frame rate.
+        # Called directly (e.g. from a benchmark) it runs in the calling thread.
+        if self._data is None:
+            self.load(self.FilePath.value())
+        if self._thread is not threading.current_thread():
+            self._run.set()
+
+        numFrames = len(self._data)
+        rate      = self.Rate.value()
+        sent      = 0
+        start     = time.perf_counter()
+        last      = start
+        self.FrameCount.set(0)
+        self.Running.set(True)
+
+        try:
+            while self._run.is_set() and (numFrames > 0) and (count is None or sent < count):
+                idx = sent % numFrames
+                if (idx == 0) and (sent > 0) and (count is None) and not self.Loop.value():
+                    break
+
+                # Pace against the absolute schedule so sleep() jitter does not accumulate
+                if rate > 0:
+                    delay = start + sent/rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                self._sendIndex(idx)
+                sent += 1
+
+                now = time.perf_counter()
+                if (now-last) >= 1.0:
+                    last = now
+                    self.FrameCount.set(sent)
+                    self.AchievedRate.set(sent/(now-start))
+        finally:
+            elapsed = time.perf_counter()-start
+            achieved = (sent/elapsed) if elapsed > 0 else 0.0
+            self.FrameCount.set(sent)
+            self.AchievedRate.set(achieved)
+            self.Running.set(False)
+
+        return achieved
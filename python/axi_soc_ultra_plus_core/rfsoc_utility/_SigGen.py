@@ -9,13 +9,43 @@
 #-----------------------------------------------------------------------------
 
 import pyrogue as pr
-import csv
+import numpy as np
+import hashlib
+import os
+import threading
+
+import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
+
+# Dirty regions of a channel separated by at most this many unchanged 32-bit words
+# are merged into one write (one transaction costs more than a few extra words)
+WAVEFORM_COALESCE_GAP = 16
+
+enumLoadState = {
+    0 : 'Idle',
+    1 : 'Busy',
+    2 : 'Done',
+    3 : 'Error',
+    4 : 'Cancelled',
+}
+
+# Raised by LoadWaveforms() when its cancel event is set
+class WaveformLoadCancelled(Exception):
+    pass
+
+# Validated full-depth RAM images returned by SigGen.prepareWaveforms()
+class PreparedWaveforms(object):
+    def __init__(self, numSamples, ram, words, digests):
+        self.numSamples = numSamples # Samples per channel
+        self.ram        = ram        # int16 [numCh, smplPerCycle*2**ramWidth]
+        self.words      = words      # Per channel 32-bit bus words
+        self.digests    = digests    # Per channel hash of the words
 
 class SigGen(pr.Device):
     def __init__(self,
             numCh        = 8,  # Must match NUM_CH_G config
             ramWidth     = 10, # Must match RAM_ADDR_WIDTH_G config
             smplPerCycle = 16, # Must match SAMPLE_PER_CYCLE_G config
+            dacBitWidth  = None, # Must match DAC_BIT_WIDTH_C (None: read from the register at start)
             **kwargs):
         super().__init__(**kwargs)
 
@@ -23,6 +53,15 @@ class SigGen(pr.Device):
         self.ramWidth     = ramWidth
         self.smplPerCycle = smplPerCycle
         self.valueStride  = 32 if (smplPerCycle==1) else 16
+        self.dacBitWidth  = dacBitWidth
+
+        # Last uploaded RAM contents (32-bit bus words) and their hash, per channel
+        self._ramCache = [None for ch in range(numCh)]
+        self._ramHash  = [None for ch in range(numCh)]
+
+        # Background loader
+        self._loadThread = None
+        self._loadCancel = threading.Event()
 
         self.add(pr.RemoteVariable(
             name         = 'NUM_CH_G',
@@ -157,6 +196,13 @@ class SigGen(pr.Device):
             value        = '',
         ))
 
+        self.add(pr.LocalVariable(
+            name         = 'CompressPeriod',
+            description  = 'LoadCsvFile uploads only the shortest repeating period of the file (BufferLength shrinks to one period: in burst mode each burst then plays one period instead of the whole file)',
+            mode         = 'RW',
+            value        = False,
+        ))
+
         @self.command(hidden=True)
         def RefreshDacFsm():
             # Toggle flags (if flags already active)
@@ -167,7 +213,7 @@ class SigGen(pr.Device):
             self.Enabled.set(Enabled)
             self.Continuous.set(Continuous)
 
-        @self.command(value='',description='Load the .CSV',)
+        @self.command(value='',description='Load a .CSV, .npy or .bin waveform file',)
         def LoadCsvFile(arg):
             # Check if non-empty argument
             if (arg != ''):
@@ -176,27 +222,291 @@ class SigGen(pr.Device):
                 # Use the variable path instead
                 path = self.CsvFilePath.get()
 
-            # Open the .CSV file
-            index = 0
-            firstRead = True
             print( f'{self.path}.LoadCsvFile({path})')
-            with open(path, mode='r', encoding='utf-8-sig') as csvfile:
-                reader = csv.reader(csvfile, delimiter=',', quoting=csv.QUOTE_NONE)
-                for row in reader:
-                    if firstRead:
-                        firstRead = False
-                        numCh = len(row)
-                    for ch in range(numCh):
-                        # Update only the shadow variable value (write performance reasons)
-                        self.Waveform[ch].set(value=int(row[ch]),index=index,write=False)
-                    index += 1
-
-            # Push all shadow variables to hardware
-            for ch in range(numCh):
-                self.Waveform[ch].write()
-
-            # Update the BufferLength register to be normalized to smplPerCycle (zero inclusive)
-            self.BufferLength.set(int(index/smplPerCycle)-1)
+            self.LoadWaveforms(self.ReadWaveformFile(path), compress=self.CompressPeriod.value())
 
-            # Toggle flags (if flags already active)
-            self.RefreshDacFsm()
+        @self.command(value='',description='Load a .CSV, .npy or .bin waveform file in the background',)
+        def LoadCsvFileAsync(arg):
+            path = arg if (arg != '') else self.CsvFilePath.get()
+            print( f'{self.path}.LoadCsvFileAsync({path})')
+            compress = self.CompressPeriod.value()
+            self.loadAsync(lambda **kwargs: self.LoadWaveforms(self.ReadWaveformFile(path), compress=compress, **kwargs))
+
+        self.add(pr.LocalVariable(
+            name         = 'LoadState',
+            description  = 'State of the background waveform load',
+            mode         = 'RO',
+            value        = 0,
+            enum         = enumLoadState,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'LoadProgress',
+            description  = 'Progress of the background waveform load',
+            mode         = 'RO',
+            value        = 0.0,
+            units        = '%',
+            disp         = '{:.1f}',
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'LoadError',
+            description  = 'Error message of the last failed background waveform load',
+            mode         = 'RO',
+            value        = '',
+        ))
+
+        @self.command(description='Cancel the background waveform load (between channels)')
+        def CancelLoad():
+            self._loadCancel.set()
+
+        @self.command(description='Forget the cached waveform RAM contents, the next load rewrites every channel')
+        def InvalidateWaveformCache():
+            self.invalidateWaveformCache()
+
+    def ReadWaveformFile(self, path):
+        # Returns the waveforms of a file as an array of shape [numCh, N], one row per channel.
+        # Files hold one sample per row and one channel per column:
+        #   .npy : int16 array of shape [N, numCh] (or [N]), memory-mapped
+        #   .bin : raw little-endian int16 samples, interleaved over the numCh channels, memory-mapped
+        #   else : comma separated text (.CSV)
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.npy':
+            data = np.load(path, mmap_mode='r')
+        elif ext == '.bin':
+            data = np.memmap(path, dtype='<i2', mode='r')
+            if data.size % self.numCh != 0:
+                raise ValueError(f'{path}: {data.size} samples is not a multiple of {self.numCh} channels')
+            data = data.reshape(-1, self.numCh)
+        else:
+            data = np.loadtxt(path, dtype=np.int64, delimiter=',', ndmin=2, encoding='utf-8-sig')
+
+        if data.ndim == 1:
+            data = data[:,np.newaxis]
+        if data.ndim != 2:
+            raise ValueError(f'{path}: expected [samples, channels], got shape {data.shape}')
+        return data.T
+
+    def _start(self):
+        super()._start()
+
+        # The RAM may have been reloaded or reset since the last upload
+        self.invalidateWaveformCache()
+
+        # The waveform variables and the length checks are sized from the constructor
+        # arguments, they must match the firmware generics (0: not readable, e.g. offline)
+        for name, value in [('RAM_ADDR_WIDTH_G', self.ramWidth), ('SAMPLE_PER_CYCLE_G', self.smplPerCycle)]:
+            generic = self.node(name).get()
+            if generic == 0:
+                print( f'{self.path}: {name} not readable, assuming {value}' )
+            elif generic != value:
+                raise ValueError(f'{self.path}: {name}={generic} but SigGen() was built for {value}')
+
+        if self.dacBitWidth is None:
+            width = self.DAC_BIT_WIDTH_C.get()
+            if (width < 1) or (width > 16):
+                print( f'{self.path}: DAC_BIT_WIDTH_C={width} is not between 1 and 16, assuming 16 (pass dacBitWidth to SigGen())' )
+                width = 16
+            self.dacBitWidth = width
+
+    def _stop(self):
+        self._loadCancel.set()
+        self.waitLoad()
+        super()._stop()
+
+    def loadAsync(self, load):
+        # Runs load(progress=..., cancel=...) on a worker thread, for example
+        #   sigGen.loadAsync(lambda **kwargs: sigGen.LoadWaveforms(waveforms, **kwargs))
+        # Returns False if a load is already running.
+        if self._loadThread is not None and self._loadThread.is_alive():
+            print( f'{self.path}.loadAsync: a waveform load is already running' )
+            return False
+
+        self._loadCancel.clear()
+        self.LoadError.set('')
+        self.LoadProgress.set(0.0)
+        self.LoadState.set(1)
+
+        def run():
+            try:
+                load(progress=lambda frac: self.LoadProgress.set(100.0*frac), cancel=self._loadCancel)
+                self.LoadState.set(2)
+            except WaveformLoadCancelled:
+                self.LoadState.set(4)
+            except Exception as e:
+                self.LoadError.set(str(e))
+                self.LoadState.set(3)
+                print( f'{self.path}.loadAsync: {e}' )
+
+        self._loadThread = threading.Thread(target=run, name=f'{self.path}.Load', daemon=True)
+        self._loadThread.start()
+        return True
+
+    def waitLoad(self, timeout=None):
+        # Blocks until the background load finishes, returns its LoadState name
+        if self._loadThread is not None:
+            self._loadThread.join(timeout)
+        return enumLoadState[self.LoadState.value()]
+
+    def invalidateWaveformCache(self, ch=None):
+        # Call this if the waveform RAM may have been written outside of LoadWaveforms()
+        for i in (range(self.numCh) if ch is None else [ch]):
+            self._ramCache[i] = None
+            self._ramHash[i]  = None
+
+    def _ramWords(self, ram):
+        # RAM image as the 32-bit words seen on the register bus
+        if self.valueStride == 16:
+            return ram.view('<u4')
+        return ram.view(np.uint16).astype('<u4')
+
+    def _dirtyRegions(self, words, cache):
+        # [start, stop) word ranges that differ from the cache, small gaps coalesced
+        dirty = np.flatnonzero(words != cache)
+        if len(dirty) == 0:
+            return []
+        splits = np.flatnonzero(np.diff(dirty) > WAVEFORM_COALESCE_GAP)
+        starts = np.concatenate(([dirty[0]], dirty[splits+1]))
+        stops  = np.concatenate((dirty[splits], [dirty[-1]]))+1
+        return list(zip(starts.tolist(), stops.tolist()))
+
+    def _writeRegions(self, ch, words, regions):
+        # Write the dirty regions straight to the RAM, the caller reads the channel back
+        offset = self.Waveform[ch].offset
+        for start, stop in regions:
+            self._rawWrite(offset+4*start, bytearray(words[start:stop].tobytes()))
+
+    def prepareWaveforms(self, waveforms, compress=False):
+        # Validates and packs waveforms for LoadWaveforms() without any hardware access,
+        # so the next waveform can be prepared while the current one plays.
+        # waveforms: array of shape [numCh, N] (or [N] for channel 0) in DAC counts,
+        # with N a multiple of smplPerCycle and at most smplPerCycle*2**ramWidth
+        # (checked against SAMPLE_PER_CYCLE_G and RAM_ADDR_WIDTH_G at start).
+        # compress: keep only the shortest repeating period (a multiple of smplPerCycle),
+        # so files holding many periods load faster and longer files can fit in the RAM.
+        waveforms = np.asarray(waveforms)
+        if waveforms.ndim == 1:
+            waveforms = waveforms[np.newaxis,:]
+        if compress:
+            period = rfsoc_utility.minimalPeriod(waveforms, self.smplPerCycle)
+            if period < waveforms.shape[1]:
+                print( f'{self.path}: waveform repeats every {period} samples, loading 1 of {waveforms.shape[1]//period} periods' )
+                waveforms = waveforms[:,:period]
+        numCh, numSamples = waveforms.shape
+        maxSamples = self.smplPerCycle*(2**self.ramWidth)
+
+        if numCh > self.numCh:
+            raise ValueError(f'{self.path}.LoadWaveforms: {numCh} channels, only {self.numCh} available')
+        if (numSamples == 0) or (numSamples > maxSamples) or (numSamples % self.smplPerCycle != 0):
+            raise ValueError(f'{self.path}.LoadWaveforms: {numSamples} samples, must be a non-zero multiple of {self.smplPerCycle} up to {maxSamples}')
+        if self.dacBitWidth is None:
+            raise ValueError(f'{self.path}.LoadWaveforms: DAC_BIT_WIDTH_C is read at start, pass dacBitWidth to SigGen() to prepare waveforms before')
+        if (waveforms.min() < -2**(self.dacBitWidth-1)) or (waveforms.max() >= 2**(self.dacBitWidth-1)):
+            raise ValueError(f'{self.path}.LoadWaveforms: samples exceed the {self.dacBitWidth}-bit DAC range')
+
+        # Pack into full-depth RAM images (the variable applies valueStride)
+        ram = np.zeros((numCh, maxSamples), dtype=np.int16)
+        ram[:,:numSamples] = waveforms
+
+        words   = [self._ramWords(ram[ch]).copy() for ch in range(numCh)]
+        digests = [hashlib.blake2b(w.tobytes(), digest_size=16).digest() for w in words]
+        return PreparedWaveforms(numSamples, ram, words, digests)
+
+    def LoadWaveforms(self, waveforms, force=False, progress=None, cancel=None, compress=False, issueGroup=2):
+        # waveforms: array of shape [numCh, N] (or [N] for channel 0) in DAC counts,
+        # with N a multiple of smplPerCycle and at most smplPerCycle*2**ramWidth,
+        # or the result of prepareWaveforms() (see there for compress).
+        # Channels beyond waveforms.shape[0] are left untouched.
+        # Channels identical to the last upload are skipped and, for the others, only
+        # the regions that changed are written, then verified by reading the channel back
+        # (unless force=True).
+        # progress: optional callable receiving the completed fraction (0.0 to 1.0)
+        # cancel:   optional threading.Event, checked between channels. A cancelled load raises
+        #           WaveformLoadCancelled, leaves BufferLength unchanged and the channels that
+        #           were not written are rewritten in full by the next load.
+        # issueGroup: with progress or cancel, channels written in full are issued in groups of
+        #           this many, reported and checked for cancel between groups. Without either,
+        #           all of them are issued at once.
+        if not isinstance(waveforms, PreparedWaveforms):
+            waveforms = self.prepareWaveforms(waveforms, compress=compress)
+        numSamples = waveforms.numSamples
+        numCh      = len(waveforms.words)
+        ram        = waveforms.ram
+
+        done = 0
+        def step():
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done/numCh)
+
+        def cancelled():
+            return (cancel is not None) and cancel.is_set()
+
+        full = []
+        diff = []
+        for ch in range(numCh):
+            if cancelled():
+                raise WaveformLoadCancelled(f'{self.path}.LoadWaveforms cancelled')
+
+            words  = waveforms.words[ch]
+            digest = waveforms.digests[ch]
+
+            # Identical to the last upload
+            if (not force) and (digest == self._ramHash[ch]):
+                step()
+                continue
+
+            # The cache is only refilled once the new contents are verified
+            cache = self._ramCache[ch]
+            self.invalidateWaveformCache(ch)
+
+            if force or (cache is None):
+                # Shadow first (no hardware access), written in full below
+                self.Waveform[ch].set(value=ram[ch], write=False)
+                full.append((ch, words, digest))
+            else:
+                self._writeRegions(ch, words, self._dirtyRegions(words, cache))
+                diff.append((ch, words, digest))
+
+        # Differential channels: reading them back refreshes the shadow from the RAM without
+        # marking it stale (a later writeBlocks() does not rewrite them) and verifies the regions
+        for ch, _, _ in diff:
+            self.readBlocks(recurse=False, variable=self.Waveform[ch])
+        for ch, words, digest in diff:
+            self.checkBlocks(recurse=False, variable=self.Waveform[ch])
+            if not np.array_equal(self.Waveform[ch].value(), ram[ch]):
+                raise pr.MemoryError(name=self.path, address=self.address+self.Waveform[ch].offset, msg=f'Waveform[{ch}] verify error')
+            self._ramCache[ch] = words
+            self._ramHash[ch]  = digest
+            step()
+
+        # Full channel writes: the writes and read-backs of a group are all issued before
+        # waiting on any of them, a single group unless someone watches progress or cancel
+        if (progress is None) and (cancel is None):
+            groupSize = max(len(full), 1)
+        else:
+            groupSize = max(int(issueGroup), 1)
+
+        for i in range(0, len(full), groupSize):
+            if cancelled():
+                raise WaveformLoadCancelled(f'{self.path}.LoadWaveforms cancelled')
+
+            group = full[i:i+groupSize]
+            for ch, _, _ in group:
+                self.writeBlocks(force=True, recurse=False, variable=self.Waveform[ch])
+            for ch, _, _ in group:
+                self.verifyBlocks(recurse=False, variable=self.Waveform[ch])
+            for ch, words, digest in group:
+                self.checkBlocks(recurse=False, variable=self.Waveform[ch])
+                self._ramCache[ch] = words
+                self._ramHash[ch]  = digest
+                step()
+
+        # Update the BufferLength register to be normalized to smplPerCycle (zero inclusive)
+        self.BufferLength.set((numSamples//self.smplPerCycle)-1)
+
+        # Toggle flags (if flags already active)
+        self.RefreshDacFsm()
@@ -13,19 +13,7 @@ import pyrogue as pr
 import numpy as np
 import click
 
-from fractions import Fraction
-from functools import reduce
-from math import gcd
-
-def lcm(a, b):
-    return a * b // gcd(a, b)
-
-def common_integer(*numbers):
-    fractions = [Fraction(n).limit_denominator() for n in numbers]
-    multiple  = reduce(lcm, [f.denominator for f in fractions])
-    ints      = [int(f * multiple) for f in fractions]
-    divisor   = reduce(gcd, ints)
-    return [int(n / divisor) for n in ints]
+import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
 
 class SigGenLoader(pr.Device):
     def __init__(self,
@@ -52,6 +40,24 @@ class SigGenLoader(pr.Device):
             value   = defaultFreq,
         ))
 
+        self.add(pr.LocalVariable(
+            name        = 'ActualFrequency',
+            description = 'Frequency loaded by LoadSingleTones (closest that wraps seamlessly in the RAM)',
+            mode        = 'RO',
+            typeStr     = 'Float[np]',
+            units       = 'Hz',
+            value       = 0.0,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'FrequencyErrorPpm',
+            description = 'ActualFrequency error with respect to Frequency',
+            mode        = 'RO',
+            value       = 0.0,
+            units       = 'ppm',
+            disp        = '{:.3f}',
+        ))
+
         phase = [90.0, 0.0, 90.0, 0.0, 90.0, 0.0, 90.0, 0.0, 90.0, 0.0, 90.0, 0.0, 90.0, 0.0, 90.0, 0.0]
 
         for i in range(self.numCh):
@@ -70,57 +76,163 @@ class SigGenLoader(pr.Device):
                 value   = phase[i],
             ))
 
-        @self.command()
-        def LoadSingleTones():
-            click.secho(f'{self.path}.LoadSingleTones(freq={self.Frequency.value()})', fg='green')
-
-            # Calculate the frequency ratio
-            freqRatio = (self._smplRate/self.Frequency.value())
-
-            # Calculate the common integers
-            commonInt = common_integer(freqRatio,self.smplPerCycle)
-
-            # Find an integer multiple of unit interval with respect to # of sample per clock cycle
-            wordLength = -1
-            for x in commonInt:
-                value = float(x)*freqRatio
-                # Check for zero remainer and multiple of samples per cycle
-                if (np.mod(value, 1) == 0) and (np.mod(value, self.smplPerCycle) == 0):
-                    wordLength = int(value)
-                    break
+            self.add(pr.LocalVariable(
+                name    = f'ChannelFrequency[{i}]',
+                typeStr = 'Float[np]',
+                units   = 'Hz',
+                value   = defaultFreq,
+            ))
 
-            ## Check if couldn't find integer multiple
-            if wordLength < 0:
-                click.secho('Unable to find an integer multiple of unit interval with respect to # of sample per clock cycle', fg='red')
-                return
+        self.add(pr.LocalVariable(
+            name        = 'ToneFrequencies',
+            description = 'Tone frequencies of the LoadMultiTone comb',
+            typeStr     = 'Float[np]',
+            units       = 'Hz',
+            value       = defaultFreq*np.arange(1, 5, dtype=np.float64),
+        ))
 
-            ## Check if couldn't find integer multiple
-            if wordLength >= self.ramDepth:
-                click.secho('waveform length longer than buffering', fg='red')
-                return
+        self.add(pr.LocalVariable(
+            name        = 'TonePhaseMode',
+            description = 'Phase assignment of the LoadMultiTone comb (Schroeder/Newman minimize the crest factor)',
+            value       = 1,
+            enum        = rfsoc_utility.enumTonePhase,
+        ))
 
-            # Loop through the channels
-            for ch in range(self.numCh):
+        self.add(pr.LocalVariable(
+            name        = 'ChirpStart',
+            typeStr     = 'Float[np]',
+            units       = 'Hz',
+            value       = defaultFreq,
+        ))
 
-                # Calculate angular frequency & phase
-                w   = 2.0*np.pi*self.Frequency.value()
-                phi = self.Phase[ch].value()*np.pi/180.0
+        self.add(pr.LocalVariable(
+            name        = 'ChirpStop',
+            typeStr     = 'Float[np]',
+            units       = 'Hz',
+            value       = 2.0*defaultFreq,
+        ))
 
-                # Load the waveforms data
-                for t in range(wordLength):
+        self.add(pr.LocalVariable(
+            name        = 'ChirpMode',
+            value       = 0,
+            enum        = rfsoc_utility.enumChirpMode,
+        ))
 
-                    # Calculate the value
-                    timeStep = float(t)*self._timeBin
-                    value    = float(self.Amplitude[ch].value())*np.sin(w*timeStep + phi)
+        self.add(pr.LocalVariable(
+            name        = 'WaveformLength',
+            description = 'Number of samples of the last loaded waveform',
+            mode        = 'RO',
+            value       = 0,
+        ))
 
-                    # Update only the shadow variable value (write performance reasons)
-                    self.DacSigGen.Waveform[ch].set(value=int(value),index=t,write=False)
+        self.add(pr.LocalVariable(
+            name        = 'ActualFrequencies',
+            description = 'Frequencies of the last loaded waveform after snapping to a periodic length (chirps: start and stop)',
+            mode        = 'RO',
+            typeStr     = 'Float[np]',
+            units       = 'Hz',
+            value       = np.zeros(1, dtype=np.float64),
+        ))
 
-                # Push all shadow variables to hardware
-                self.DacSigGen.Waveform[ch].write()
+        self.add(pr.LocalVariable(
+            name        = 'CrestFactor',
+            description = 'Peak to RMS ratio of the last loaded waveform (channel 0)',
+            mode        = 'RO',
+            value       = 0.0,
+            units       = 'dB',
+            disp        = '{:.2f}',
+        ))
 
-            # Update the BufferLength register to be normalized to smplPerCycle (zero inclusive)
-            self.DacSigGen.BufferLength.set((wordLength//self.smplPerCycle)-1)
+        @self.command(description='Load one tone per channel at ChannelFrequency[i]')
+        def LoadChannelTones():
+            freqs = np.array([self.ChannelFrequency[ch].value() for ch in range(self.numCh)], dtype=np.float64)
+            click.secho(f'{self.path}.LoadChannelTones(freq={freqs})', fg='green')
+
+            # One length periodic for every channel
+            wordLength, actual = rfsoc_utility.periodicLength(freqs, self._smplRate, self.smplPerCycle, self.smplPerCycle*self.ramDepth)
+
+            t     = np.arange(wordLength, dtype=np.float64)*self._timeBin
+            value = np.sin(2.0*np.pi*actual[:,np.newaxis]*t[np.newaxis,:] + self._phases()[:,np.newaxis])
+            self._load(value, actual)
+
+        @self.command(description='Load the ToneFrequencies comb on all channels, scaled by Amplitude[i]')
+        def LoadMultiTone():
+            freqs = np.atleast_1d(np.asarray(self.ToneFrequencies.value(), dtype=np.float64))
+            mode  = rfsoc_utility.enumTonePhase[self.TonePhaseMode.value()]
+            click.secho(f'{self.path}.LoadMultiTone(freq={freqs}, phase={mode})', fg='green')
+
+            wordLength, actual = rfsoc_utility.periodicLength(freqs, self._smplRate, self.smplPerCycle, self.smplPerCycle*self.ramDepth)
+            comb = rfsoc_utility.multiTone(
+                freqs      = actual,
+                sampleRate = self._smplRate,
+                numSamples = wordLength,
+                phases     = rfsoc_utility.tonePhases(len(actual), mode),
+            )
+            self._load(np.broadcast_to(comb, (self.numCh, wordLength)), actual)
+
+        @self.command(description='Load a ChirpStart to ChirpStop sweep over the full RAM on all channels')
+        def LoadChirp():
+            mode = rfsoc_utility.enumChirpMode[self.ChirpMode.value()]
+            click.secho(f'{self.path}.LoadChirp({self.ChirpStart.value()} to {self.ChirpStop.value()}, {mode})', fg='green')
+
+            wordLength = self.smplPerCycle*self.ramDepth
+            value = np.empty((self.numCh, wordLength), dtype=np.float64)
+            for ch, phi in enumerate(self._phases()):
+                value[ch], stop = rfsoc_utility.chirp(
+                    f0         = float(self.ChirpStart.value()),
+                    f1         = float(self.ChirpStop.value()),
+                    sampleRate = self._smplRate,
+                    numSamples = wordLength,
+                    mode       = mode,
+                    phase      = phi,
+                )
+            self._load(value, np.array([self.ChirpStart.value(), stop], dtype=np.float64))
 
-            # Toggle flags (if flags already active)
-            self.DacSigGen.RefreshDacFsm()
+        @self.command()
+        def LoadSingleTones():
+            self.DacSigGen.LoadWaveforms(self._singleTones())
+
+        @self.command(description='LoadSingleTones on a worker thread, see DacSigGen.LoadState/LoadProgress')
+        def LoadSingleTonesAsync():
+            self.DacSigGen.loadAsync(lambda **kwargs: self.DacSigGen.LoadWaveforms(self._singleTones(), **kwargs))
+
+    def _singleTones(self):
+        click.secho(f'{self.path}.LoadSingleTones(freq={self.Frequency.value()})', fg='green')
+
+        # Shortest seamless buffer for the closest achievable frequency
+        wordLength, freq, errorPpm = rfsoc_utility.bestFitLength(
+            freq         = self.Frequency.value(),
+            sampleRate   = self._smplRate,
+            smplPerCycle = self.smplPerCycle,
+            ramDepth     = self.ramDepth,
+        )
+        self.ActualFrequency.set(freq)
+        self.FrequencyErrorPpm.set(errorPpm)
+        if abs(errorPpm) > 1.0E-6:
+            click.secho(f'{self.path}.LoadSingleTones: using {freq} Hz ({errorPpm:+.3f} ppm)', fg='yellow')
+
+        # Synthesize all the channels in one vectorized expression
+        w     = 2.0*np.pi*freq
+        phi   = self._phases()
+        amp   = np.array([self.Amplitude[ch].value() for ch in range(self.numCh)], dtype=np.float64)
+        t     = np.arange(wordLength, dtype=np.float64)*self._timeBin
+        value = amp[:,np.newaxis]*np.sin(w*t[np.newaxis,:] + phi[:,np.newaxis])
+        self.WaveformLength.set(wordLength)
+
+        # Truncated toward zero like int()
+        return value.astype(np.int16)
+
+    def _phases(self):
+        return np.array([self.Phase[ch].value() for ch in range(self.numCh)], dtype=np.float64)*np.pi/180.0
+
+    def _load(self, value, actual):
+        # value: [numCh, N] waveforms with a peak of 1.0, scaled by Amplitude[i]
+        amp = np.array([self.Amplitude[ch].value() for ch in range(self.numCh)], dtype=np.float64)
+        waveforms = amp[:,np.newaxis]*value
+
+        self.WaveformLength.set(waveforms.shape[1])
+        self.ActualFrequencies.set(np.asarray(actual, dtype=np.float64))
+        self.CrestFactor.set(float(rfsoc_utility.crestFactor(waveforms[0])))
+
+        # One bulk load of all the channels, truncated toward zero like int()
+        self.DacSigGen.LoadWaveforms(waveforms.astype(np.int16))
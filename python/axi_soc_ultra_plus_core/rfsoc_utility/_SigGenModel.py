@@ -0,0 +1,223 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import rogue.interfaces.memory as rim
+import numpy as np
+
+import threading
+import time
+
+# Software model of the DAC signal generator register block and waveform RAMs.
+#
+# Use it as the memBase of a SigGen device (in place of the AXI-Lite bus) to run the
+# loaders without hardware, then call render() to get the samples the firmware would play:
+#
+#   model = rfsoc_utility.SigGenModel(numCh=2, ramWidth=10, smplPerCycle=16)
+#   self.add(rfsoc_utility.SigGen(memBase=model, offset=0x0, numCh=2, ramWidth=10, smplPerCycle=16))
+#
+# Modeled behavior (SigGenReg.vhd/SigGenFsm.vhd):
+#   - Enabled=0: pass-through (and FSM reset), render() returns the 'bypass' samples (zeros by default)
+#   - Idle FSM (after Reset or at the end of the bursts): IdleValue
+#   - SoftwareTrigger: only seen by the idle FSM, 2 cycles of start up (IdleValue) then
+#     BurstSize+1 bursts of BufferLength+1 cycles, then back to idle
+#   - Continuous=1: the idle FSM starts right away and the buffer wraps forever, a burst
+#     in progress keeps wrapping
+#   - Reset, or a write that changes BurstSize or BufferLength, returns the FSM to idle,
+#     from where continuous playback restarts immediately
+#   - BurstCnt counts down from BurstSize during the bursts, based on wall time at sampleRate
+class SigGenModel(rim.Slave):
+    def __init__(self,
+            numCh        = 8,
+            ramWidth     = 10,
+            smplPerCycle = 16,
+            sampleRate   = 5.0E+9, # Units of Hz (used for the BurstCnt status)
+            base         = 0x0,    # Address of the SigGen registers on this slave
+            dacBitWidth  = 16):
+        rim.Slave.__init__(self, 4, 0x4_0000)
+        self.numCh        = numCh
+        self.ramWidth     = ramWidth
+        self.smplPerCycle = smplPerCycle
+        self.sampleRate   = sampleRate
+        self.base         = base
+        self.valueStride  = 32 if (smplPerCycle==1) else 16
+
+        self._lock = threading.Lock()
+        self._regs = np.zeros(0x24>>2, dtype=np.uint32)
+        self._regs[0] = numCh | (ramWidth<<8) | (smplPerCycle<<16) | (dacBitWidth<<24)
+
+        # Waveform RAMs as raw bytes, one 18-bit address window per channel
+        self._ramBytes = smplPerCycle*(2**ramWidth)*self.valueStride//8
+        self._ram      = np.zeros((numCh, self._ramBytes), dtype=np.uint8)
+
+        # Start of the current play out: None (idle), 'burst' or 'continuous'
+        self._mode      = None
+        self._startTime = 0.0
+
+        # Counters for throughput measurements
+        self.readBytes  = 0
+        self.writeBytes = 0
+
+    # Register accessors
+    def _reg(self, offset):
+        return int(self._regs[offset>>2])
+
+    @property
+    def burstSize(self):
+        return self._reg(0x08)
+
+    @property
+    def bufferLength(self):
+        return self._reg(0x0C) & ((1<<self.ramWidth)-1)
+
+    @property
+    def continuous(self):
+        return self._reg(0x10) & 0x1
+
+    @property
+    def idleValue(self):
+        return np.int16(np.uint16(self._reg(0x18) & 0xFFFF))
+
+    @property
+    def enabled(self):
+        return self._reg(0x20) & 0x1
+
+    def waveform(self, ch):
+        # Channel RAM contents as int16 samples
+        if self.valueStride == 16:
+            return self._ram[ch].view('<i2')
+        return self._ram[ch].view('<u4').astype(np.uint16).view(np.int16)
+
+    def _burstCnt(self):
+        if self._mode != 'burst':
+            return 0
+        cycles  = (time.perf_counter()-self._startTime)*self.sampleRate/self.smplPerCycle - 2
+        idx     = int(max(0.0, cycles)//(self.bufferLength+1))
+        return max(0, self.burstSize-idx)
+
+    def _idle(self):
+        # The FSM waits in IDLE_S: never started, or the last burst has been played out
+        if self._mode != 'burst':
+            return self._mode is None
+        cycles = (time.perf_counter()-self._startTime)*self.sampleRate/self.smplPerCycle - 2
+        return cycles >= (self.burstSize+1)*(self.bufferLength+1)
+
+    def _play(self, mode):
+        self._mode      = mode
+        self._startTime = time.perf_counter()
+
+    def _resetFsm(self):
+        # Back to IDLE_S, which starts again on the next cycle if Continuous is set
+        if self.enabled and self.continuous:
+            self._play('continuous')
+        else:
+            self._mode = None
+
+    def _writeReg(self, offset, value):
+        if offset in [0x00, 0x04]:
+            return # Read only
+
+        # SoftwareTrigger: ignored unless the FSM is idle
+        if offset == 0x14:
+            if (value & 0x1) and self.enabled and self._idle():
+                self._play('burst')
+            return
+
+        if offset == 0x1C:
+            if value & 0x1:
+                self._resetFsm()
+            return
+
+        prev = self._reg(offset)
+        self._regs[offset>>2] = value
+
+        # SigGenReg resets the FSM when the burst size or buffer length changes
+        if offset == 0x0C:
+            mask = (1<<self.ramWidth)-1
+            if (prev & mask) != (value & mask):
+                self._resetFsm()
+            return
+        if offset == 0x08:
+            if prev != value:
+                self._resetFsm()
+            return
+
+        # Enabled/Continuous
+        if not self.enabled:
+            self._mode = None
+        elif self.continuous:
+            if self._idle():
+                self._play('continuous')
+            elif self._mode == 'burst':
+                self._mode = 'continuous' # Keeps wrapping from the same start
+        elif self._mode == 'continuous':
+            self._mode = None
+
+    def _doTransaction(self, transaction):
+        address = transaction.address()-self.base
+        size    = transaction.size()
+        ttype   = transaction.type()
+
+        with self._lock, transaction.lock():
+            ba = bytearray(size)
+
+            # Waveform RAMs
+            if address >= 0x4_0000:
+                ch  = (address>>18)-1
+                off = address & 0x3_FFFF
+                if (ch >= self.numCh) or (off+size > self._ramBytes):
+                    transaction.error(f'SigGenModel: address 0x{transaction.address():x} out of range')
+                    return
+                if (ttype == rim.Write) or (ttype == rim.Post):
+                    transaction.getData(ba, 0)
+                    self._ram[ch, off:off+size] = np.frombuffer(ba, dtype=np.uint8)
+                    self.writeBytes += size
+                else:
+                    ba[:] = self._ram[ch, off:off+size].tobytes()
+                    transaction.setData(ba, 0)
+                    self.readBytes += size
+                transaction.done()
+                return
+
+            # Registers (32-bit words)
+            if (address < 0) or (address+size > 4*len(self._regs)) or (address & 0x3) or (size & 0x3):
+                transaction.error(f'SigGenModel: address 0x{transaction.address():x} out of range')
+                return
+            if (ttype == rim.Write) or (ttype == rim.Post):
+                transaction.getData(ba, 0)
+                for i, value in enumerate(np.frombuffer(ba, dtype='<u4')):
+                    self._writeReg(address+4*i, int(value))
+            else:
+                self._regs[1] = self._burstCnt()
+                ba[:] = self._regs[address>>2:(address+size)>>2].astype('<u4').tobytes()
+                transaction.setData(ba, 0)
+            transaction.done()
+
+    def render(self, ch, numSamples, bypass=None):
+        # Samples channel ch outputs over numSamples samples from the last trigger
+        # (or from the start of continuous mode) with the current settings
+        with self._lock:
+            if not self.enabled:
+                return np.zeros(numSamples, dtype=np.int16) if bypass is None else np.asarray(bypass, dtype=np.int16)[:numSamples]
+
+            out = np.full(numSamples, self.idleValue, dtype=np.int16)
+            if self._mode is None:
+                return out
+
+            # FSM start up, then the buffer
+            start  = 2*self.smplPerCycle
+            length = (self.bufferLength+1)*self.smplPerCycle
+            if self._mode == 'continuous':
+                total = max(0, numSamples-start)
+            else:
+                total = min(max(0, numSamples-start), (self.burstSize+1)*length)
+
+            idx = np.arange(total) % length
+            out[start:start+total] = self.waveform(ch)[idx]
+            return out
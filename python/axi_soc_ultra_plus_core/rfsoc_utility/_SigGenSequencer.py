@@ -0,0 +1,238 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import pyrogue as pr
+import numpy as np
+
+import concurrent.futures
+import threading
+import time
+
+# One playlist entry
+class SigGenPlaylistEntry(object):
+    def __init__(self, waveforms, bursts=1, dwell=0.0):
+        self.waveforms = waveforms # [numCh, N] DAC counts (see SigGen.LoadWaveforms)
+        self.bursts    = int(bursts) # Number of times the waveform is played
+        self.dwell     = float(dwell) # Idle time after the last burst, units of seconds
+        if self.bursts < 1:
+            raise ValueError('A playlist entry needs at least one burst')
+
+# Plays a list of waveforms through SigGen in burst mode.
+#
+# The SigGen has a single waveform RAM and no start address register, so the next entry
+# cannot be staged in hardware while the current one plays. Instead the next entry is
+# validated and packed on the host (SigGen.prepareWaveforms) while the current one plays,
+# and only the upload (differential, see SigGen.LoadWaveforms) happens between bursts.
+#
+# Burst completion: BurstCnt counts down from BurstSize and the FSM returns to 0 when
+# it goes idle, so 0 is ambiguous during the last burst. The sequencer waits until
+# BurstCnt reads 0 and at least the expected burst duration has elapsed since the trigger.
+class SigGenSequencer(pr.Device):
+    def __init__(self,
+            DacSigGen    = None,
+            sampleRate   = 5.0E+9, # Units of Hz
+            pollPeriod   = 0.0005, # Units of seconds
+            **kwargs):
+        super().__init__(**kwargs)
+
+        self.DacSigGen   = DacSigGen
+        self._smplRate   = sampleRate
+        self._pollPeriod = pollPeriod
+        self._playlist   = []
+        self._thread     = None
+        self._halt       = threading.Event()
+        self._gaps       = []
+
+        self.add(pr.LocalVariable(
+            name        = 'Repeat',
+            description = 'Restart the playlist after the last entry',
+            mode        = 'RW',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'NumEntries',
+            description = 'Number of entries in the playlist',
+            mode        = 'RO',
+            value       = 0,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'Running',
+            description = 'Sequence is playing',
+            mode        = 'RO',
+            value       = False,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'Index',
+            description  = 'Playlist entry being played',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'EntriesPlayed',
+            description  = 'Number of entries played since StartSequence',
+            mode         = 'RO',
+            value        = 0,
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'LastGap',
+            description  = 'Software dead time between the end of the last burst (plus dwell) and the next trigger',
+            mode         = 'RO',
+            value        = 0.0,
+            units        = 'ms',
+            disp         = '{:.3f}',
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'MeanGap',
+            mode         = 'RO',
+            value        = 0.0,
+            units        = 'ms',
+            disp         = '{:.3f}',
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name         = 'MaxGap',
+            mode         = 'RO',
+            value        = 0.0,
+            units        = 'ms',
+            disp         = '{:.3f}',
+            pollInterval = 1,
+        ))
+
+        self.add(pr.LocalVariable(
+            name        = 'SequenceError',
+            description = 'Error message of the last failed sequence',
+            mode        = 'RO',
+            value       = '',
+        ))
+
+        @self.command(description='Play the playlist from the first entry')
+        def StartSequence():
+            self.StopSequence()
+            if len(self._playlist) == 0:
+                print( f'{self.path}.StartSequence: empty playlist' )
+                return
+            self._halt.clear()
+            self._thread = threading.Thread(target=self._sequence, name=f'{self.path}.Sequence', daemon=True)
+            self._thread.start()
+
+        @self.command(description='Stop after the current burst')
+        def StopSequence():
+            self._halt.set()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+
+    def _stop(self):
+        self.StopSequence()
+        super()._stop()
+
+    def setPlaylist(self, entries):
+        # entries: list of SigGenPlaylistEntry or (waveforms, bursts, dwell) tuples
+        self._playlist = [e if isinstance(e, SigGenPlaylistEntry) else SigGenPlaylistEntry(*e) for e in entries]
+        self.NumEntries.set(len(self._playlist))
+
+    def addEntry(self, waveforms, bursts=1, dwell=0.0):
+        self._playlist.append(SigGenPlaylistEntry(waveforms, bursts, dwell))
+        self.NumEntries.set(len(self._playlist))
+
+    def clearPlaylist(self):
+        self._playlist = []
+        self.NumEntries.set(0)
+
+    def gaps(self):
+        # Measured inter-burst gaps of the current/last sequence, units of seconds
+        return np.array(self._gaps)
+
+    def _waitBursts(self, entry, numSamples, trigTime):
+        # Expected play time: 2 cycles of FSM start up plus the bursts
+        cycles   = numSamples//self.DacSigGen.smplPerCycle
+        duration = (entry.bursts*cycles + 2)*self.DacSigGen.smplPerCycle/self._smplRate
+
+        while not self._halt.is_set():
+            if (time.perf_counter()-trigTime >= duration) and (self.DacSigGen.BurstCnt.get() == 0):
+                return True
+            self._halt.wait(self._pollPeriod)
+        return False
+
+    def _recordGap(self, gap):
+        self._gaps.append(gap)
+        self.LastGap.set(1.0E+3*gap)
+        self.MeanGap.set(1.0E+3*float(np.mean(self._gaps)))
+        self.MaxGap.set(1.0E+3*float(np.max(self._gaps)))
+
+    def _sequence(self):
+        sigGen = self.DacSigGen
+        self._gaps = []
+        self.EntriesPlayed.set(0)
+        self.SequenceError.set('')
+        self.Running.set(True)
+
+        try:
+            # Burst mode with the FSM enabled
+            sigGen.Continuous.set(0)
+            sigGen.Enabled.set(1)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                idx      = 0
+                prepared = pool.submit(sigGen.prepareWaveforms, self._playlist[0].waveforms)
+                readyAt  = None # Time at which the previous entry (and its dwell) finished
+
+                while not self._halt.is_set():
+                    entry = self._playlist[idx]
+                    self.Index.set(idx)
+
+                    # Upload and trigger
+                    waveforms = prepared.result()
+                    sigGen.LoadWaveforms(waveforms)
+                    sigGen.BurstSize.set(entry.bursts-1)
+                    sigGen.SoftwareTrigger()
+                    trigTime = time.perf_counter()
+
+                    if readyAt is not None:
+                        self._recordGap(trigTime-readyAt)
+
+                    # Prepare the next entry while this one plays
+                    nxt = idx+1
+                    if nxt == len(self._playlist):
+                        if not self.Repeat.value():
+                            nxt = None
+                        else:
+                            nxt = 0
+                    if nxt is not None:
+                        prepared = pool.submit(sigGen.prepareWaveforms, self._playlist[nxt].waveforms)
+
+                    if not self._waitBursts(entry, waveforms.numSamples, trigTime):
+                        break
+                    self.EntriesPlayed += 1
+
+                    if (entry.dwell > 0) and self._halt.wait(entry.dwell):
+                        break
+                    readyAt = time.perf_counter()
+
+                    if nxt is None:
+                        break
+                    idx = nxt
+
+        except Exception as e:
+            self.SequenceError.set(str(e))
+            print( f'{self.path}: {e}' )
+
+        finally:
+            self.Running.set(False)
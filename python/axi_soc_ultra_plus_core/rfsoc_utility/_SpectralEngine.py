@@ -0,0 +1,113 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import inspect
+import numpy as np
+
+enumFftWindow = {
+    0 : 'Rectangular',
+    1 : 'Hann',
+    2 : 'BlackmanHarris',
+    3 : 'FlatTop',
+}
+
+# Generalized cosine window coefficients: w[n] = sum_k (-1)^k * a[k] * cos(2*pi*k*n/N)
+windowCoefficients = {
+    'Rectangular'    : (1.0,),
+    'Hann'           : (0.5, 0.5),
+    'BlackmanHarris' : (0.35875, 0.48829, 0.14128, 0.01168),
+    'FlatTop'        : (0.21557895, 0.41663158, 0.277263158, 0.083578947, 0.006947368),
+}
+
+# numpy>=2.0 can write the rfft result into a preallocated output buffer
+_RFFT_OUT = 'out' in inspect.signature(np.fft.rfft).parameters
+
+def cosineWindow(name, size):
+    # Periodic (DFT-even) window, which is the correct choice for spectral analysis
+    if name not in windowCoefficients:
+        raise ValueError(f'Unknown FFT window "{name}", must be one of {list(windowCoefficients)}')
+    phase = (2.0*np.pi/float(size))*np.arange(size, dtype=np.float64)
+    win   = np.zeros(size, dtype=np.float64)
+    for k, a in enumerate(windowCoefficients[name]):
+        win += ((-1.0)**k)*a*np.cos(k*phase)
+    return win
+
+class SpectralPlan(object):
+    # Window and work buffers for one (shape, window) combination
+    def __init__(self, shape, window, fullScale):
+        self.shape = tuple(shape)
+        size       = self.shape[-1]
+        half       = size>>1
+
+        # Fold the coherent gain and full scale normalization into the window
+        # so that |X|^2 is directly in units of full scale power
+        win         = cosineWindow(window, size)
+        self.window = (win/(np.sum(win)*fullScale)).astype(np.float32)
+
+        # Preallocated output buffers
+        self.work  = np.zeros(self.shape, dtype=np.float32)
+        self.spec  = np.zeros(self.shape[:-1]+(half+1,), dtype=np.complex64)
+        self.power = np.zeros(self.shape[:-1]+(half,), dtype=np.float32)
+        self.dbfs  = np.zeros(self.shape[:-1]+(half,), dtype=np.float32)
+
+class SpectralEngine(object):
+    def __init__(self, window='Rectangular', fullScale=32767.0):
+        self._fullScale = fullScale
+        self._plans     = {}
+        self.window     = window
+
+    @property
+    def window(self):
+        return self._window
+
+    @window.setter
+    def window(self, value):
+        if value not in windowCoefficients:
+            raise ValueError(f'Unknown FFT window "{value}", must be one of {list(windowCoefficients)}')
+        self._window = value
+
+    def plan(self, shape):
+        key = (tuple(shape), self._window)
+        if key not in self._plans:
+            self._plans[key] = SpectralPlan(shape, self._window, self._fullScale)
+        return self._plans[key]
+
+    def power(self, data):
+        # Returns the single-sided power spectrum (units of full scale power).
+        # The returned array is owned by the plan and overwritten on the next call.
+        plan = self.plan(data.shape)
+        half = plan.power.shape[-1]
+
+        # Single precision conversion and windowing in one pass
+        np.multiply(data, plan.window, out=plan.work)
+
+        # Real FFT (only the non-negative frequencies are computed)
+        if _RFFT_OUT:
+            np.fft.rfft(plan.work, axis=-1, out=plan.spec)
+        else:
+            plan.spec[...] = np.fft.rfft(plan.work, axis=-1)
+
+        # |X|^2 for the first half (DC up to but excluding Nyquist)
+        np.abs(plan.spec[...,:half], out=plan.power)
+        np.square(plan.power, out=plan.power)
+        return plan.power
+
+    def dbfs(self, data):
+        # Returns the single-sided magnitude spectrum in units of dBFS.
+        # The returned array is owned by the plan and overwritten on the next call.
+        power = self.power(data)
+        plan  = self.plan(data.shape)
+
+        # Prevent warning message when for divide by zero encountered in log10
+        # Checking for inf later to fix this in the display
+        with np.errstate(divide='ignore'):
+            np.log10(power, out=plan.dbfs)
+        plan.dbfs *= 10.0
+        return plan.dbfs
@@ -0,0 +1,154 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+# Minimum number of bins on each side of a tone that hold its energy (main lobe),
+# indexed by the SpectralEngine window name. The actual span of every tone grows
+# outward from there until its leakage reaches the noise floor (see spectralMetrics()).
+windowLeakageBins = {
+    'Rectangular'    : 1,
+    'Hann'           : 2,
+    'BlackmanHarris' : 4,
+    'FlatTop'        : 5,
+}
+
+# Leakage is considered at the noise floor once a bin is below this factor times the
+# median bin power (the median of an exponentially distributed noise bin is 0.69x its mean)
+LEAKAGE_FLOOR_FACTOR = 2.0
+
+# Smallest power used before log10 (-300 dBFS)
+_POWER_FLOOR = 1.0E-30
+
+def _db(x):
+    return 10.0*np.log10(np.maximum(x, _POWER_FLOOR))
+
+def _extent(p, peaks, floor, minSpan, maxSpan):
+    # [lo, hi] bins of the tones at peaks [rows, tones], grown outward from each peak until a
+    # bin is at or below the row's floor or the spectrum ends, at least minSpan and at most
+    # maxSpan bins on each side. Also returns whether both sides settled within maxSpan.
+    nb   = p.shape[-1]
+    rows = np.arange(p.shape[0])[:,None,None]
+    step = np.arange(1, maxSpan+1)
+    ret  = []
+    for sign in (-1, +1):
+        idx  = peaks[...,None] + sign*step
+        out  = (idx < 0) | (idx >= nb)
+        stop = out | (p[rows, np.clip(idx, 0, nb-1)] <= floor[:,None,None])
+
+        # First stop on this side (maxSpan if none), a sentinel column keeps argmax exact
+        stop  = np.concatenate((stop, np.ones(stop.shape[:-1]+(1,), dtype=bool)), axis=-1)
+        first = np.argmax(stop, axis=-1)
+        ret.append((np.maximum(first, minSpan), first < maxSpan))
+
+    (lo, loOk), (hi, hiOk) = ret
+    return np.maximum(peaks-lo, 0), np.minimum(peaks+hi, nb-1), (loOk & hiOk)
+
+def spectralMetrics(power, window='Rectangular', numHarmonics=5, span=None, maxSpan=None):
+    # Converter figures of merit from a single-sided power spectrum.
+    #
+    # power        : linear power spectrum of shape [..., N/2] (DC up to but excluding
+    #                Nyquist), as returned by SpectralEngine.power(); any leading
+    #                dimensions (e.g. channels) are processed in one vectorized pass
+    # window       : window used to compute the spectrum (sets the minimum leakage span)
+    # numHarmonics : harmonics 2..numHarmonics+1 are counted as distortion
+    # span         : fixed number of bins on each side of a tone (disables the adaptive span)
+    # maxSpan      : largest adaptive span on each side of a tone (default N/32 bins)
+    #
+    # Tone, harmonic and DC powers are the sum of the bins around their peak, grown outward
+    # on each side until the bins reach the noise floor (LEAKAGE_FLOOR_FACTOR times the median
+    # bin), so the ratios depend neither on the window's coherent gain/ENBW nor on how fast
+    # its sidelobes decay. Harmonics are folded back into the first Nyquist zone. The noise
+    # power is the mean of the remaining bins extrapolated over the full band (without DC).
+    #
+    # The metrics are only meaningful if the fundamental's leakage settles within maxSpan.
+    # With the Rectangular window this requires a coherently sampled tone (no growth beyond
+    # the main lobe). Otherwise 'valid' is False and snr/sinad/thd/sfdr/enob are NaN.
+    #
+    # Returns a dict of arrays with the leading shape of 'power':
+    #   snr, sinad, thd (dBc), sfdr (dBc), enob (bits), valid,
+    #   fundamentalBin, fundamentalPower (dBFS, peak bin)
+    p       = np.asarray(power, dtype=np.float64)
+    shape   = p.shape[:-1]
+    nb      = p.shape[-1]
+    N       = 2*nb
+    p       = p.reshape(-1, nb)
+    rows    = np.arange(p.shape[0])
+    minSpan = windowLeakageBins[window] if span is None else int(span)
+    maxSpan = max(nb//16, minSpan) if maxSpan is None else max(int(maxSpan), minSpan)
+    bins    = np.arange(nb)
+    h       = np.arange(2, numHarmonics+2)
+
+    if span is None:
+        floor = LEAKAGE_FLOOR_FACTOR*np.median(p[:,1:], axis=-1)
+        def extent(peaks):
+            return _extent(p, peaks, floor, minSpan, maxSpan)
+    else:
+        def extent(peaks):
+            return np.maximum(peaks-minSpan, 0), np.minimum(peaks+minSpan, nb-1), np.ones(peaks.shape, dtype=bool)
+
+    # DC (and its leakage) is never part of the signal, distortion or noise
+    _, dcHi, _ = extent(np.zeros((p.shape[0],1), dtype=np.int64))
+    dcHi   = dcHi[:,0]
+    dcMask = bins <= dcHi[:,None]
+
+    # Fundamental: largest bin outside of DC
+    fund = np.argmax(np.where(dcMask, -1.0, p), axis=-1)
+
+    # Fundamental and harmonic (folded into [0, N/2)) extents in one pass, tone 0 is the fundamental
+    hBins = np.mod(fund[:,None]*h, N)
+    hBins = np.minimum(np.where(hBins > nb, N-hBins, hBins), nb-1)
+    lo, hi, settled = extent(np.concatenate((fund[:,None], hBins), axis=-1))
+    toneMask = (bins >= lo[...,None]) & (bins <= hi[...,None])
+
+    sigMask   = toneMask[:,0]
+    harmMask  = np.any(toneMask[:,1:], axis=1) & ~(sigMask | dcMask)
+    noiseMask = ~(sigMask | harmMask | dcMask)
+
+    # Band powers
+    pSig   = np.sum(np.where(sigMask, p, 0.0), axis=-1)
+    pHarm  = np.sum(np.where(harmMask, p, 0.0), axis=-1)
+    pNoise = (np.sum(np.where(noiseMask, p, 0.0), axis=-1)/np.maximum(np.sum(noiseMask, axis=-1), 1))*(nb-dcHi-1)
+
+    # Largest spur: any bin outside of the fundamental and DC (harmonics included)
+    spur  = np.max(np.where(sigMask | dcMask, 0.0, p), axis=-1)
+    pFund = p[rows, fund]
+
+    # Rectangular window: only coherently sampled tones (leakage within the main lobe)
+    # (a few bins of margin for noise bins above the floor next to the main lobe)
+    valid = settled[:,0]
+    if (window == 'Rectangular') and (span is None):
+        valid &= (hi[:,0]-lo[:,0]) <= 2*(minSpan+3)
+
+    sinad  = _db(pSig) - _db(pNoise+pHarm)
+    retVar = {
+        'snr'              : _db(pSig) - _db(pNoise),
+        'sinad'            : sinad,
+        'thd'              : _db(pHarm) - _db(pSig),
+        'sfdr'             : _db(pFund) - _db(spur),
+        'enob'             : (sinad-1.76)/6.02,
+        'fundamentalBin'   : fund.astype(np.int64),
+        'fundamentalPower' : _db(pFund),
+        'valid'            : valid,
+    }
+    for k in ['snr', 'sinad', 'thd', 'sfdr', 'enob']:
+        retVar[k] = np.where(valid, retVar[k], np.nan)
+
+    return {k : v.reshape(shape) for k, v in retVar.items()}
+
+# Variable name, spectralMetrics() key, units and description for the processors' metric variables
+spectralMetricVariables = [
+    ('SNR',              'snr',              'dB',   'Signal to noise ratio'),
+    ('SFDR',             'sfdr',             'dBc',  'Spurious free dynamic range'),
+    ('SINAD',            'sinad',            'dB',   'Signal to noise and distortion ratio'),
+    ('ENOB',             'enob',             'bits', 'Effective number of bits, from SINAD'),
+    ('THD',              'thd',              'dBc',  'Total harmonic distortion'),
+    ('FundamentalPower', 'fundamentalPower', 'dBFS', 'Peak bin power of the fundamental'),
+]
@@ -0,0 +1,142 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+enumFftAveragingMode = {
+    0 : 'Running',     # Boxcar average of the last N spectra
+    1 : 'Exponential', # Exponential moving average with alpha=1/N
+}
+
+enumFftAveragingDomain = {
+    0 : 'dB',    # Average the dBFS values (log-average)
+    1 : 'Power', # Average the linear power, then convert to dBFS
+}
+
+# Floor applied before log10 so that the running sum never sees -inf
+_POWER_FLOOR = 1.0E-30 # -300 dBFS
+
+class SpectrumAverager(object):
+    def __init__(self, shape, depth=1, mode='Running', domain='dB'):
+        self._shape  = tuple(shape)
+        self._depth  = int(depth)
+        self._mode   = mode
+        self._domain = domain
+
+        # Internally every leading axis is flattened into rows, each with its own history
+        self._rows = int(np.prod(self._shape[:-1], dtype=np.int64))
+        self._bins = self._shape[-1]
+
+        # Preallocated work and output buffers
+        self._work = np.zeros((self._rows,self._bins), dtype=np.float32)
+        self._dbfs = np.zeros((self._rows,self._bins), dtype=np.float32)
+        self._idx   = np.zeros(self._rows, dtype=np.int64)
+        self._count = np.zeros(self._rows, dtype=np.int64)
+
+        self.configure()
+
+    @property
+    def depth(self):
+        return self._depth
+
+    @property
+    def count(self):
+        return int(self._count.max())
+
+    def configure(self, depth=None, mode=None, domain=None):
+        if depth is not None:
+            self._depth = max(1, int(depth))
+        if mode is not None:
+            if mode not in enumFftAveragingMode.values():
+                raise ValueError(f'Unknown averaging mode "{mode}"')
+            self._mode = mode
+        if domain is not None:
+            if domain not in enumFftAveragingDomain.values():
+                raise ValueError(f'Unknown averaging domain "{domain}"')
+            self._domain = domain
+
+        # Running mode keeps the last N spectra and a float64 running sum,
+        # Exponential mode only needs the current average
+        if self._mode == 'Running':
+            self._ring = np.zeros((self._depth,self._rows,self._bins), dtype=np.float32)
+            self._acc  = np.zeros((self._rows,self._bins), dtype=np.float64)
+        else:
+            self._ring = None
+            self._acc  = np.zeros((self._rows,self._bins), dtype=np.float32)
+
+        self.reset()
+
+    def reset(self, rows=None):
+        # Restarts the average of the given rows (all of them by default)
+        rows = slice(None) if rows is None else rows
+        self._idx[rows]   = 0
+        self._count[rows] = 0
+        self._acc[rows]   = 0.0
+        if self._ring is not None:
+            self._ring[:,rows] = 0.0
+
+    def update(self, power, rows=None):
+        # Takes a linear power spectrum (units of full scale power) and returns
+        # the averaged spectrum in dBFS. With rows (indices into the leading axis)
+        # only those rows are updated and power holds just those rows, in order.
+        # The returned array is owned by the averager and overwritten on the next call.
+        if rows is None:
+            rows = np.arange(self._rows)
+        rows  = np.asarray(rows, dtype=np.int64)
+        num   = len(rows)
+        x     = self._work[:num]
+        power = np.reshape(power, (num,self._bins))
+
+        if self._domain == 'dB':
+            np.maximum(power, _POWER_FLOOR, out=x)
+            np.log10(x, out=x)
+            x *= 10.0
+        else:
+            np.copyto(x, power)
+
+        count = np.minimum(self._count[rows]+1, self._depth)
+        self._count[rows] = count
+
+        if self._mode == 'Running':
+            # Subtract the oldest spectrum and add the newest: cost is independent of depth
+            idx = self._idx[rows]
+            acc = self._acc[rows]
+            acc -= self._ring[idx,rows]
+            acc += x
+            self._ring[idx,rows] = x
+
+            # Re-sum once per pass through the ring to bound the rounding drift
+            idx += 1
+            wrap = (idx == self._depth)
+            if wrap.any():
+                idx[wrap] = 0
+                acc[wrap] = np.sum(self._ring[:,rows[wrap]], axis=0, dtype=np.float64)
+            self._idx[rows] = idx
+            self._acc[rows] = acc
+
+            np.divide(acc, count[:,None], out=x, casting='same_kind')
+        else:
+            # Cumulative mean until the depth is reached, then alpha=1/depth
+            acc = self._acc[rows]
+            x -= acc
+            x /= count[:,None]
+            acc += x
+            self._acc[rows] = acc
+            np.copyto(x, acc)
+
+        dbfs = self._dbfs[:num]
+        if self._domain == 'dB':
+            np.copyto(dbfs, x)
+        else:
+            np.maximum(x, _POWER_FLOOR, out=x)
+            np.log10(x, out=dbfs)
+            dbfs *= 10.0
+
+        return dbfs.reshape(self._shape) if num == self._rows else dbfs
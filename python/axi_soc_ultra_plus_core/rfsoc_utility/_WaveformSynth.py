@@ -0,0 +1,164 @@
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+from fractions import Fraction
+from functools import reduce
+from math import gcd
+
+enumTonePhase = {
+    0 : 'Zero',      # All tones start at 0 degrees (worst crest factor)
+    1 : 'Schroeder', # phi_k = -pi*k*(k-1)/K
+    2 : 'Newman',    # phi_k = pi*(k-1)**2/K
+    3 : 'Random',    # Uniform random phases (fixed seed)
+}
+
+enumChirpMode = {
+    0 : 'Linear',
+    1 : 'Exponential',
+}
+
+def tonePhases(numTones, mode='Schroeder', seed=0):
+    # Phases (radians) for a comb of numTones tones, chosen to keep the crest factor low
+    k = np.arange(1, numTones+1, dtype=np.float64)
+    if mode == 'Zero':
+        return np.zeros(numTones)
+    if mode == 'Schroeder':
+        return -np.pi*k*(k-1.0)/numTones
+    if mode == 'Newman':
+        return np.pi*(k-1.0)**2/numTones
+    if mode == 'Random':
+        return np.random.default_rng(seed).uniform(-np.pi, np.pi, size=numTones)
+    raise ValueError(f'Unknown tone phase mode "{mode}", must be one of {list(enumTonePhase.values())}')
+
+def crestFactor(x):
+    # Peak to RMS ratio in dB
+    x   = np.asarray(x, dtype=np.float64)
+    rms = np.sqrt(np.mean(x*x))
+    return 20.0*np.log10(np.max(np.abs(x))/rms) if rms > 0 else 0.0
+
+def _lcm(a, b):
+    return a * b // gcd(a, b)
+
+def bestFitLength(freq, sampleRate, smplPerCycle, ramDepth):
+    # Shortest waveform length N = smplPerCycle*L (L <= ramDepth) holding an integer number
+    # of cycles M of the tone closest to freq, from the continued fraction expansion of
+    # freq*smplPerCycle/sampleRate (best rational approximation M/L with L <= ramDepth).
+    # Returns (N, actualFreq, errorPpm).
+    ratio = Fraction(float(freq)*smplPerCycle/float(sampleRate)).limit_denominator(ramDepth)
+    if ratio.numerator <= 0:
+        # Below the lowest frequency that fits in the RAM: one cycle over the full depth
+        ratio = Fraction(1, ramDepth)
+    N      = smplPerCycle*ratio.denominator
+    actual = float(ratio.numerator)*sampleRate/N
+    error  = 1.0E+6*(actual-freq)/freq if freq != 0 else 0.0
+    return N, actual, error
+
+def periodicLength(freqs, sampleRate, smplPerCycle, maxSamples, tolerance=1.0E-12):
+    # Smallest waveform length N (a multiple of smplPerCycle, at most maxSamples) over which
+    # every tone completes an integer number of cycles, so that the RAM loops seamlessly.
+    #
+    # If no such length exists, the tones are snapped to the nearest FFT bin of the longest
+    # valid length. Returns (N, actualFreqs).
+    freqs = np.atleast_1d(np.asarray(freqs, dtype=np.float64))
+    maxN  = (maxSamples//smplPerCycle)*smplPerCycle
+
+    # A single tone always has a best-fit length
+    if len(freqs) == 1:
+        N, actual, _ = bestFitLength(freqs[0], sampleRate, smplPerCycle, maxSamples//smplPerCycle)
+        return N, np.array([actual])
+
+    # Each tone needs N to be a multiple of the denominator of f/fs
+    ratios = [Fraction(float(f/sampleRate)).limit_denominator(maxN) for f in freqs]
+    exact  = all(abs(float(r)-f/sampleRate) <= tolerance*max(1.0, abs(f/sampleRate)) for r, f in zip(ratios, freqs))
+    if exact:
+        N = reduce(_lcm, [r.denominator for r in ratios], smplPerCycle)
+        if N <= maxN:
+            return N, np.array([float(r) for r in ratios])*sampleRate
+
+    # Snap to the bins of the longest valid length
+    N = maxN
+    bins = np.round(freqs*N/sampleRate)
+    return N, bins*sampleRate/N
+
+def multiTone(freqs, sampleRate, numSamples, amplitudes=None, phases=None):
+    # Sum of tones as float64 samples normalized to a peak of 1.0.
+    # The tones must complete an integer number of cycles over numSamples (see periodicLength()),
+    # the comb is then built in one inverse real FFT instead of one sine per tone.
+    freqs = np.atleast_1d(np.asarray(freqs, dtype=np.float64))
+    amplitudes = np.ones(len(freqs)) if amplitudes is None else np.broadcast_to(np.asarray(amplitudes, dtype=np.float64), freqs.shape)
+    phases     = np.zeros(len(freqs)) if phases is None else np.broadcast_to(np.asarray(phases, dtype=np.float64), freqs.shape)
+
+    bins = np.round(freqs*numSamples/sampleRate).astype(np.int64)
+    if np.any(np.abs(bins - freqs*numSamples/sampleRate) > 1.0E-6):
+        raise ValueError('Tones are not periodic over the waveform length, use periodicLength()')
+    if np.any(bins <= 0) or np.any(2*bins >= numSamples):
+        raise ValueError('Tones must be between DC and Nyquist (exclusive)')
+
+    # Cosine of phase phi at bin k: X[k] = (N/2)*A*exp(j*phi)
+    spec = np.zeros((numSamples>>1)+1, dtype=np.complex128)
+    np.add.at(spec, bins, 0.5*numSamples*amplitudes*np.exp(1j*phases))
+    x = np.fft.irfft(spec, n=numSamples)
+    peak = np.max(np.abs(x))
+    return x/peak if peak > 0 else x
+
+def chirp(f0, f1, sampleRate, numSamples, mode='Linear', phase=0.0, periodic=True):
+    # Single sweep from f0 to f1 over numSamples as float64 samples with a peak of 1.0.
+    # With periodic=True the stop frequency of a linear chirp is adjusted so the sweep
+    # ends on an integer number of cycles (no phase step when the RAM loops).
+    # Returns (samples, actualStopFreq).
+    T = numSamples/sampleRate
+    t = np.arange(numSamples, dtype=np.float64)/sampleRate
+
+    if mode == 'Linear':
+        if periodic:
+            cycles = max(1.0, np.round(0.5*(f0+f1)*T))
+            f1 = 2.0*cycles/T - f0
+        arg = f0*t + 0.5*(f1-f0)*t*t/T
+
+    elif mode == 'Exponential':
+        if (f0 <= 0) or (f1 <= 0):
+            raise ValueError('Exponential chirps need non-zero start and stop frequencies')
+        if f0 == f1:
+            arg = f0*t
+        else:
+            k   = f1/f0
+            arg = f0*T*(np.power(k, t/T)-1.0)/np.log(k)
+
+    else:
+        raise ValueError(f'Unknown chirp mode "{mode}", must be one of {list(enumChirpMode.values())}')
+
+    return np.sin(2.0*np.pi*arg + phase), f1
+
+def minimalPeriod(waveforms, multiple=1):
+    # Shortest period P of the [numCh, N] (or [N]) waveforms, with P a multiple of 'multiple'
+    # that divides N, such that every channel repeats exactly every P samples. Returns N if
+    # there is no shorter period.
+    #
+    # Candidates are screened with the circular autocorrelation of all channels (one FFT pass,
+    # a periodic signal correlates fully at its period) then confirmed with an exact compare.
+    x = np.atleast_2d(np.asarray(waveforms))
+    N = x.shape[-1]
+    candidates = [p for p in range(multiple, N, multiple) if N % p == 0]
+    if len(candidates) == 0:
+        return N
+
+    xf   = x.astype(np.float64)
+    spec = np.fft.rfft(xf, axis=-1)
+    acf  = np.sum(np.fft.irfft(spec*np.conj(spec), n=N, axis=-1), axis=0)
+    if acf[0] <= 0:
+        # All zeros: any period works
+        return candidates[0]
+
+    for p in candidates:
+        if (acf[p] >= acf[0]*(1.0-1.0E-9)) and np.array_equal(x[:,p:], x[:,:N-p]):
+            return p
+    return N
@@ -1,12 +1,19 @@
 from axi_soc_ultra_plus_core.rfsoc_utility._AppRingBuffer       import *
 from axi_soc_ultra_plus_core.rfsoc_utility._SigGen              import *
+from axi_soc_ultra_plus_core.rfsoc_utility._WaveformSynth       import *
 from axi_soc_ultra_plus_core.rfsoc_utility._SigGenLoader        import *
+from axi_soc_ultra_plus_core.rfsoc_utility._SigGenSequencer     import *
+from axi_soc_ultra_plus_core.rfsoc_utility._SigGenModel         import *
 from axi_soc_ultra_plus_core.rfsoc_utility._SigToAxiStream      import *
+from axi_soc_ultra_plus_core.rfsoc_utility._SpectralEngine      import *
+from axi_soc_ultra_plus_core.rfsoc_utility._SpectrumAverager    import *
+from axi_soc_ultra_plus_core.rfsoc_utility._FrameWorkQueue      import *
+from axi_soc_ultra_plus_core.rfsoc_utility._DisplayDecimator    import *
+from axi_soc_ultra_plus_core.rfsoc_utility._SpectralMetrics     import *
 from axi_soc_ultra_plus_core.rfsoc_utility._RingBufferProcessor import *
-
-from axi_soc_ultra_plus_core.rfsoc_utility._RfdcBlock import *
-from axi_soc_ultra_plus_core.rfsoc_utility._RfdcTile  import *
-from axi_soc_ultra_plus_core.rfsoc_utility._Rfdc      import *
+from axi_soc_ultra_plus_core.rfsoc_utility._MultiChannelRingBufferProcessor import *
+from axi_soc_ultra_plus_core.rfsoc_utility._RingBufferRecorder  import *
+from axi_soc_ultra_plus_core.rfsoc_utility._RingBufferReplay    import *
 
 enumCustomStartUp = {
     0x0 : "XRFDC_STATE_OFF",
@@ -90,3 +97,10 @@ enumRefClkSource = {
     0 : "XRFDC_EXTERNAL_CLK",     #define XRFDC_EXTERNAL_CLK 0x0U
     1 : "XRFDC_INTERNAL_PLL_CLK", #define XRFDC_INTERNAL_PLL_CLK 0x1U
 }
+
+# The RFDC register tables reference the enums above when they are defined
+from axi_soc_ultra_plus_core.rfsoc_utility._RfdcRegisterTable import *
+from axi_soc_ultra_plus_core.rfsoc_utility._RfdcSnapshot import *
+from axi_soc_ultra_plus_core.rfsoc_utility._RfdcBlock import *
+from axi_soc_ultra_plus_core.rfsoc_utility._RfdcTile  import *
+from axi_soc_ultra_plus_core.rfsoc_utility._Rfdc      import *
@@ -31,6 +31,7 @@ class GuiTop(Display):
         self.title  = None
         self.numAdcCh = None
         self.numDacCh = None
+        self.decimated = False
 
         for a in args:
             if 'sizeX=' in a:
@@ -43,6 +44,8 @@ class GuiTop(Display):
                 self.numAdcCh = int(a.split('=')[1])
             if 'numDacCh=' in a:
                 self.numDacCh = int(a.split('=')[1])
+            if 'decimated=' in a:
+                self.decimated = bool(int(a.split('=')[1]))
 
         if self.title is None:
             self.title = "Rogue Server: {}".format(os.getenv('ROGUE_SERVERS'))
@@ -73,11 +76,11 @@ class GuiTop(Display):
         self.tab.addTab(var,'Debug Tree')
 
         # ADC Live Display (Tab Index=2)
-        adcDisplay = gui.LiveDisplay(parent=None, init_channel=Channel, dispType='Adc', numCh=self.numAdcCh)
+        adcDisplay = gui.LiveDisplay(parent=None, init_channel=Channel, dispType='Adc', numCh=self.numAdcCh, decimated=self.decimated)
         self.tab.addTab(adcDisplay,'ADC Waveforms')
 
         # DAC Live Display (Tab Index=3)
-        dacDisplay = gui.LiveDisplay(parent=None, init_channel=Channel, dispType='Dac', numCh=self.numDacCh)
+        dacDisplay = gui.LiveDisplay(parent=None, init_channel=Channel, dispType='Dac', numCh=self.numDacCh, decimated=self.decimated)
         self.tab.addTab(dacDisplay,'DAC Waveforms')
 
         # Set the default Tab view
@@ -17,7 +17,7 @@ from qtpy.QtWidgets import QVBoxLayout, QFormLayout, QGroupBox
 from pyrogue.pydm.data_plugins.rogue_plugin import nodeFromAddress
 
 class LiveDisplay(PyDMFrame):
-    def __init__(self, parent=None, init_channel=None, dispType='Adc', numCh=8):
+    def __init__(self, parent=None, init_channel=None, dispType='Adc', numCh=8, decimated=False):
         PyDMFrame.__init__(self, parent, init_channel)
         self._node     = None
         self._dispType = dispType
@@ -27,6 +27,16 @@ class LiveDisplay(PyDMFrame):
         self.idx       = 0
         self.RxEnable  = [nodeFromAddress(self.path[i]+'.RxEnable') for i in range(self.numCh)]
 
+        # Decimated display variables (requires RingBufferProcessor(dispPoints>0))
+        if decimated:
+            self.timeVar = ('TimeDisplay', 'WaveformDisplay')
+            self.freqVar = ('FreqDisplay', 'MagnitudeDisplay')
+            self.symbol  = {'symbol' : None}
+        else:
+            self.timeVar = ('Time', 'WaveformData')
+            self.freqVar = ('Freq', 'Magnitude')
+            self.symbol  = {'symbol' : 'o', 'symbolSize' : 3}
+
     def resetScales(self):
         # Reset the auto-ranging
         self.timePlot.resetAutoRangeX()
@@ -52,18 +62,16 @@ class LiveDisplay(PyDMFrame):
 
         # Add new curve item with respect to channel select
         self.timePlot.addChannel(
-            x_channel  = f'{self.path[self.idx]}.Time',
-            y_channel  = f'{self.path[self.idx]}.WaveformData',
+            x_channel  = f'{self.path[self.idx]}.{self.timeVar[0]}',
+            y_channel  = f'{self.path[self.idx]}.{self.timeVar[1]}',
             color      = self.color[self.idx],
-            symbol     = 'o',
-            symbolSize = 3,
+            **self.symbol,
         )
         self.freqPlot.addChannel(
-            x_channel  = f'{self.path[self.idx]}.Freq',
-            y_channel  = f'{self.path[self.idx]}.Magnitude',
+            x_channel  = f'{self.path[self.idx]}.{self.freqVar[0]}',
+            y_channel  = f'{self.path[self.idx]}.{self.freqVar[1]}',
             color      = self.color[self.idx],
-            symbol     = 'o',
-            symbolSize = 3,
+            **self.symbol,
         )
 
         # Reset the auto-ranging
@@ -99,11 +107,10 @@ class LiveDisplay(PyDMFrame):
         self.timePlot.setLabel("bottom", text='Time (ns)')
         self.timePlot.addChannel(
             name       = 'Counts',
-            x_channel  = f'{self.path[self.idx]}.Time',
-            y_channel  = f'{self.path[self.idx]}.WaveformData',
+            x_channel  = f'{self.path[self.idx]}.{self.timeVar[0]}',
+            y_channel  = f'{self.path[self.idx]}.{self.timeVar[1]}',
             color      = self.color[self.idx],
-            symbol     = 'o',
-            symbolSize = 3,
+            **self.symbol,
         )
         fl.addWidget(self.timePlot)
 
@@ -122,11 +129,10 @@ class LiveDisplay(PyDMFrame):
         self.freqPlot.setLabel("bottom", text='Frequency (MHz)')
         self.freqPlot.addChannel(
             name       = 'Amplitude (dBFS)',
-            x_channel  = f'{self.path[self.idx]}.Freq',
-            y_channel  = f'{self.path[self.idx]}.Magnitude',
+            x_channel  = f'{self.path[self.idx]}.{self.freqVar[0]}',
+            y_channel  = f'{self.path[self.idx]}.{self.freqVar[1]}',
             color      = self.color[self.idx],
-            symbol     = 'o',
-            symbolSize = 3,
+            **self.symbol,
         )
         self.freqPlot.setAutoRangeY(False)
         self.freqPlot.setMinYRange(-140.0)
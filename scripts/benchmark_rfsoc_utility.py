@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+#-----------------------------------------------------------------------------
+# This file is part of the 'axi-soc-ultra-plus-core'. It is subject to
+# the license terms in the LICENSE.txt file found in the top-level directory
+# of this distribution and at:
+#    https://confluence.slac.stanford.edu/display/ppareg/LICENSE.html.
+# No part of the 'axi-soc-ultra-plus-core', including this file, may be
+# copied, modified, propagated, or distributed except according to the terms
+# contained in the LICENSE.txt file.
+#-----------------------------------------------------------------------------
+# Benchmarks of the rfsoc_utility hot paths, without hardware:
+#   - RingBufferProcessor frames/s (fed by RingBufferReplay) per maxSize/FftAveraging
+#   - SigGenLoader.LoadSingleTones and SigGen.LoadCsvFile wall time per ramWidth/numCh
+#     (register accesses go to SigGenModel, which also checks the played back samples
+#     and the FSM transitions)
+#   - Rfdc/RfdcTile/RfdcBlock tree build and start time
+#
+# Example:
+#   python scripts/benchmark_rfsoc_utility.py --output bench.json
+#   python scripts/benchmark_rfsoc_utility.py --quick --only process
+#-----------------------------------------------------------------------------
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pyrogue as pr
+import pyrogue.interfaces.simulation
+
+import axi_soc_ultra_plus_core.rfsoc_utility as rfsoc_utility
+
+class MemRoot(pr.Root):
+    # Root with a memory emulator standing in for the register bus
+    def __init__(self, **kwargs):
+        super().__init__(pollEn=False, timeout=5.0, **kwargs)
+        self.mem = pyrogue.interfaces.simulation.MemEmulate()
+        self.addInterface(self.mem)
+
+def testTone(numFrames, maxSize, sampleRate=5.0E+9, freq=200.0E+6):
+    # [numFrames, maxSize] int16 tone plus noise, phase varies per frame
+    rng   = np.random.default_rng(0)
+    t     = np.arange(maxSize)/sampleRate
+    phase = rng.uniform(0, 2*np.pi, size=(numFrames,1))
+    data  = 16000.0*np.sin(2*np.pi*freq*t[np.newaxis,:] + phase)
+    data += rng.normal(0, 4.0, size=data.shape)
+    return np.round(data).astype(np.int16)
+
+def benchProcess(args, workDir):
+    results = []
+    for maxSize in args.max_size:
+        path = os.path.join(workDir, f'frames_{maxSize}.npy')
+        np.save(path, testTone(args.file_frames, maxSize))
+
+        for depth in args.depth:
+            for mode in args.process_mode:
+                root = MemRoot(name='BenchRoot')
+                root.add(rfsoc_utility.RingBufferReplay(name='Replay', numCh=1))
+                root.add(rfsoc_utility.RingBufferProcessor(
+                    name       = 'Proc',
+                    maxSize    = maxSize,
+                    maxAve     = max(args.depth),
+                    defaultAve = depth,
+                    zeroCopy   = (mode == 'zeroCopy'),
+                    asyncMode  = (mode == 'async'),
+                ))
+                root.Replay.port(0) >> root.Proc
+
+                root.start()
+                try:
+                    root.Proc.RxEnable.set(True)
+                    root.Replay.FilePath.set(path)
+                    root.Replay.load(path)
+
+                    # Warm up (plan/averager allocation, page cache)
+                    root.Replay.replay(count=args.warmup)
+
+                    fps = root.Replay.replay(count=args.frames)
+
+                    # In async mode the replay rate is the ingestion rate, wait for the worker
+                    if mode == 'async':
+                        start = time.perf_counter()
+                        root.Proc.countReset()
+                        root.Replay.replay(count=args.frames)
+                        while root.Proc.FramesProcessed.get()+root.Proc.FramesDropped.get() < args.frames:
+                            time.sleep(0.001)
+                        processed = root.Proc.FramesProcessed.get()
+                        fps = processed/(time.perf_counter()-start)
+                finally:
+                    root.stop()
+
+                print(f'process: maxSize={maxSize:6d} depth={depth:4d} mode={mode:9s} {fps:10.1f} frames/s')
+                results.append({
+                    'maxSize' : maxSize,
+                    'depth'   : depth,
+                    'mode'    : mode,
+                    'frames'  : args.frames,
+                    'fps'     : fps,
+                })
+    return results
+
+def timed(func, repeat):
+    # Best of 'repeat' wall times
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter()-start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def checkSigGenFsm(sigGen, model, smplPerCycle):
+    # FSM transitions that SigGenModel must reproduce from SigGenReg.vhd/SigGenFsm.vhd
+    start  = 2*smplPerCycle
+    length = (sigGen.BufferLength.get()+1)*smplPerCycle
+    wave   = model.waveform(0)[:length].copy()
+    checks = {}
+
+    def playing():
+        return bool(np.array_equal(model.render(0, start+length)[start:], wave))
+
+    def idle():
+        return bool(np.all(model.render(0, start+length) == model.idleValue))
+
+    # Reset with Enabled and Continuous set: the idle FSM restarts the playback right away
+    sigGen.Enabled.set(1)
+    sigGen.Continuous.set(1)
+    sigGen.Reset()
+    checks['resetRestartsContinuous'] = playing()
+
+    # SoftwareTrigger during continuous playback is ignored (no burst is counted)
+    sigGen.BurstSize.set(100)
+    sigGen.SoftwareTrigger()
+    checks['triggerIgnoredInContinuous'] = (sigGen.BurstCnt.get() == 0) and playing()
+
+    # Writing a new BufferLength resets a burst in progress back to idle
+    sigGen.Continuous.set(0)
+    sigGen.BurstSize.set(2**31)
+    sigGen.SoftwareTrigger()
+    running = sigGen.BurstCnt.get() > 0
+    bufferLength = sigGen.BufferLength.get()
+    sigGen.BufferLength.set(bufferLength-1 if bufferLength > 0 else 1)
+    checks['bufferLengthResetsBurst'] = running and (sigGen.BurstCnt.get() == 0) and idle()
+
+    # Writing a new BurstSize does the same
+    sigGen.BufferLength.set(bufferLength)
+    sigGen.SoftwareTrigger()
+    running = sigGen.BurstCnt.get() > 0
+    sigGen.BurstSize.set(2**30)
+    checks['burstSizeResetsBurst'] = running and (sigGen.BurstCnt.get() == 0) and idle()
+
+    return checks
+
+def benchSigGen(args, workDir):
+    results = []
+    for ramWidth in args.ram_width:
+        for numCh in args.num_ch:
+            # Register block and waveform RAMs modeled in software
+            model = rfsoc_utility.SigGenModel(
+                numCh        = numCh,
+                ramWidth     = ramWidth,
+                smplPerCycle = args.smpl_per_cycle,
+            )
+
+            root = MemRoot(name='BenchRoot')
+            root.addInterface(model)
+            root.add(rfsoc_utility.SigGen(
+                name         = 'DacSigGen',
+                numCh        = numCh,
+                ramWidth     = ramWidth,
+                smplPerCycle = args.smpl_per_cycle,
+                memBase      = model,
+                offset       = 0x0000_0000,
+            ))
+            root.add(rfsoc_utility.SigGenLoader(
+                name         = 'SigGenLoader',
+                DacSigGen    = root.DacSigGen,
+                numCh        = numCh,
+                ramWidth     = ramWidth,
+                smplPerCycle = args.smpl_per_cycle,
+                sampleRate   = 5.0E+9,
+                defaultFreq  = 200.0E+6,
+            ))
+
+            # Full-depth waveform CSV
+            path = os.path.join(workDir, f'waveform_{ramWidth}_{numCh}.csv')
+            numSamples = args.smpl_per_cycle*(2**ramWidth)
+            data = testTone(numCh, numSamples).T
+            np.savetxt(path, data, fmt='%d', delimiter=',')
+
+            def fullLoad(load):
+                # Invalidate the differential cache so every channel is rewritten
+                root.DacSigGen.invalidateWaveformCache()
+                load()
+
+            root.start()
+            try:
+                tones = timed(lambda: fullLoad(root.SigGenLoader.LoadSingleTones), args.repeat)
+                csv   = timed(lambda: fullLoad(lambda: root.DacSigGen.LoadCsvFile(path)), args.repeat)
+                model.writeBytes = 0
+                csvCached = timed(lambda: root.DacSigGen.LoadCsvFile(path), args.repeat)
+                cachedBytes = model.writeBytes
+
+                # End to end check: what the model plays matches the file
+                root.DacSigGen.Enabled.set(1)
+                root.DacSigGen.Continuous.set(1)
+                played = np.array([model.render(ch, 2*args.smpl_per_cycle+numSamples)[2*args.smpl_per_cycle:] for ch in range(numCh)])
+                match  = bool(np.array_equal(played, data.T))
+                fsm    = checkSigGenFsm(root.DacSigGen, model, args.smpl_per_cycle)
+            finally:
+                root.stop()
+
+            print(f'sigGen: ramWidth={ramWidth:2d} numCh={numCh:2d} LoadSingleTones={tones:8.3f} s LoadCsvFile={csv:8.3f} s (cached {csvCached:8.3f} s) playback match={match} fsm={all(fsm.values())}')
+            for name, ok in fsm.items():
+                if not ok:
+                    print(f'sigGen: FSM check {name} failed')
+            results.append({
+                'ramWidth'          : ramWidth,
+                'numCh'             : numCh,
+                'smplPerCycle'      : args.smpl_per_cycle,
+                'loadSingleTones'   : tones,
+                'loadCsvFile'       : csv,
+                'loadCsvFileCached' : csvCached,
+                'cachedWriteBytes'  : cachedBytes,
+                'throughput'        : 2*numCh*numSamples/csv, # Bytes/s
+                'playbackMatch'     : match,
+                'fsmChecks'         : fsm,
+            })
+    return results
+
+def benchRfdc(args, workDir):
+    results = []
+    for gen3 in [True, False]:
+        for numTiles in [1, 4]:
+            enTile = [i < numTiles for i in range(4)]
+
+            start = time.perf_counter()
+            root = MemRoot(name='BenchRoot')
+            root.add(rfsoc_utility.Rfdc(
+                name      = 'Rfdc',
+                gen3      = gen3,
+                enAdcTile = enTile,
+                enDacTile = enTile,
+                memBase   = root.mem,
+                offset    = 0x0000_0000,
+            ))
+            build = time.perf_counter()-start
+
+            start = time.perf_counter()
+            root.start()
+            started = time.perf_counter()-start
+            root.stop()
+
+            numVars = len(root.variableList)
+            print(f'rfdc: gen3={gen3!s:5s} tiles={numTiles} build={build:6.3f} s start={started:6.3f} s variables={numVars}')
+            results.append({
+                'gen3'      : gen3,
+                'numTiles'  : numTiles,
+                'build'     : build,
+                'start'     : started,
+                'variables' : numVars,
+            })
+    return results
+
+benchmarks = {
+    'process' : benchProcess,
+    'sigGen'  : benchSigGen,
+    'rfdc'    : benchRfdc,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of the rfsoc_utility hot paths')
+    parser.add_argument('--output',         type=str, default='benchmark_rfsoc_utility.json', help='JSON results file')
+    parser.add_argument('--only',           type=str, nargs='+', choices=list(benchmarks), default=list(benchmarks), help='Benchmarks to run')
+    parser.add_argument('--quick',          action='store_true', help='Small parameter grid for a smoke test')
+    parser.add_argument('--max-size',       type=int, nargs='+', default=[2**10, 2**12, 2**14, 2**16], help='RingBufferProcessor maxSize values')
+    parser.add_argument('--depth',          type=int, nargs='+', default=[1, 4, 64, 256], help='FftAveraging depths')
+    parser.add_argument('--process-mode',   type=str, nargs='+', choices=['default','zeroCopy','async'], default=['default','zeroCopy'], help='RingBufferProcessor ingestion modes')
+    parser.add_argument('--frames',         type=int, default=2000, help='Frames per process measurement')
+    parser.add_argument('--warmup',         type=int, default=100, help='Warm up frames per process measurement')
+    parser.add_argument('--file-frames',    type=int, default=64, help='Distinct frames in the replay file')
+    parser.add_argument('--ram-width',      type=int, nargs='+', default=[9, 10, 11, 12], help='SigGen ramWidth values')
+    parser.add_argument('--num-ch',         type=int, nargs='+', default=[1, 8], help='SigGen numCh values')
+    parser.add_argument('--smpl-per-cycle', type=int, default=16, help='SigGen smplPerCycle')
+    parser.add_argument('--repeat',         type=int, default=3, help='Repetitions of the load measurements (best is kept)')
+    args = parser.parse_args()
+
+    if args.quick:
+        args.max_size  = [2**10, 2**12]
+        args.depth     = [1, 16]
+        args.frames    = 200
+        args.warmup    = 10
+        args.ram_width = [9]
+        args.num_ch    = [1, 2]
+        args.repeat    = 1
+
+    report = {
+        'timestamp' : datetime.datetime.now().isoformat(),
+        'host'      : platform.node(),
+        'platform'  : platform.platform(),
+        'python'    : sys.version.split()[0],
+        'numpy'     : np.__version__,
+        'rogue'     : getattr(pr, '__version__', 'unknown'),
+        'args'      : vars(args),
+        'results'   : {},
+    }
+
+    with tempfile.TemporaryDirectory() as workDir:
+        for name in args.only:
+            report['results'][name] = benchmarks[name](args, workDir)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'Results written to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -29,6 +29,7 @@
 #include "xrfdc_hw.h"
 
 #include <inttypes.h>
+#include <chrono>
 #include <string>
 
 #include "rogue/GilRelease.h"
@@ -123,6 +124,13 @@ PyRFdc::PyRFdc() : rim::Slave(4,0x1000) { // Set min=4B and max=4kB
     blockId_ = 0;
     data_ = 0;
 
+    memset(snapshot_, 0, sizeof(snapshot_));
+    snapshotCount_ = 0;
+
+    asyncState_ = ASYNC_STATE_IDLE;
+    asyncCmd_ = 0;
+    asyncCount_ = 0;
+
     // Loop through type indexes
     for(i=0; i<2; i++) {
         // Loop through tile indexes
@@ -233,6 +241,11 @@ PyRFdc::~PyRFdc() {
     // Log the destruction of the class
     log_->debug("PyRFdc::~PyRFdc() called");
 
+    // Wait for the running command (if any)
+    if (asyncThread_.joinable()) {
+        asyncThread_.join();
+    }
+
 #ifndef __BAREMETAL__
     struct metal_device *deviceptr = nullptr;
     if (XRFdc_RegisterMetal(RFdcInstPtr_, RFDC_DEVICE_ID, &deviceptr) == XRFDC_SUCCESS && deviceptr) {
@@ -3172,6 +3185,214 @@ void PyRFdc::TileCurrentState() {
     }
 }
 
+void PyRFdc::CaptureSnapshot() {
+    XRFdc_IPStatus IPStatus;
+    XRFdc_TileStatus TileStatus;
+    XRFdc_BlockStatus BlockStatus;
+    uint32_t settings;
+    uint32_t errors = 0;
+    uint32_t* tile;
+    uint32_t* block;
+    int i, j, k;
+
+    memset(snapshot_, 0, sizeof(snapshot_));
+    memset(&IPStatus, 0, sizeof(IPStatus));
+
+    // https://docs.amd.com/r/en-US/pg269-rf-data-converter/XRFdc_GetIPStatus
+    if (XRFdc_GetIPStatus(RFdcInstPtr_, &IPStatus) != XRFDC_SUCCESS) {
+        errors++;
+    }
+
+    // Loop through type indexes
+    for(i=0; i<2; i++) {
+        // Loop through tile indexes
+        for(j=0; j<4; j++) {
+            tile = &snapshot_[SNAPSHOT_HDR_WORDS + (4*i+j)*(SNAPSHOT_TILE_WORDS+4*SNAPSHOT_BLOCK_WORDS)];
+
+            // Absent tiles and blocks are left all zeros
+            if (XRFdc_CheckTileEnabled(RFdcInstPtr_, i, j) == XRFDC_FAILURE) {
+                continue;
+            }
+
+            // https://docs.amd.com/r/en-US/pg269-rf-data-converter/struct-XRFdc_TileStatus
+            TileStatus = (i==0) ? IPStatus.ADCTileStatus[j] : IPStatus.DACTileStatus[j];
+            tile[0] = uint32_t(TileStatus.IsEnabled);
+            tile[1] = uint32_t(TileStatus.TileState);
+            tile[2] = uint32_t(TileStatus.BlockStatusMask);
+            tile[3] = uint32_t(TileStatus.PowerUpState);
+            tile[4] = uint32_t(TileStatus.PLLState);
+
+            // https://docs.amd.com/r/en-US/pg269-rf-data-converter/XRFdc_GetPLLLockStatus
+            if (XRFdc_GetPLLLockStatus(RFdcInstPtr_, i, j, &settings) == XRFDC_SUCCESS) {
+                tile[5] = settings;
+            } else {
+                errors++;
+            }
+
+            // https://docs.amd.com/r/en-US/pg269-rf-data-converter/Current-State-Register-0x000C
+            tile[6] = XRFdc_ReadReg(RFdcInstPtr_, XRFDC_CTRL_STS_BASE(i, j), 0x000C);
+
+            // https://docs.amd.com/r/en-US/pg269-rf-data-converter/RF-DAC/RF-ADC-Tile-n-Common-Status-Register-0x0228
+            tile[7] = XRFdc_ReadReg(RFdcInstPtr_, XRFDC_CTRL_STS_BASE(i, j), 0x0228);
+
+            // Loop through block indexes
+            for(k=0; k<4; k++) {
+                block = tile + SNAPSHOT_TILE_WORDS + k*SNAPSHOT_BLOCK_WORDS;
+
+                if (XRFdc_CheckBlockEnabled(RFdcInstPtr_, i, j, k) == XRFDC_FAILURE) {
+                    continue;
+                }
+
+                // https://docs.amd.com/r/en-US/pg269-rf-data-converter/XRFdc_GetBlockStatus
+                if (XRFdc_GetBlockStatus(RFdcInstPtr_, i, j, k, &BlockStatus) != XRFDC_SUCCESS) {
+                    errors++;
+                    continue;
+                }
+
+                // https://docs.amd.com/r/en-US/pg269-rf-data-converter/struct-XRFdc_BlockStatus
+                block[0] = DoubleToUint32(BlockStatus.SamplingFreq, false);
+                block[1] = DoubleToUint32(BlockStatus.SamplingFreq, true);
+                block[2] = uint32_t(BlockStatus.AnalogDataPathStatus);
+                block[3] = uint32_t(BlockStatus.DigitalDataPathStatus);
+                block[4] = uint32_t(BlockStatus.DataPathClocksStatus);
+                block[5] = uint32_t(BlockStatus.IsFIFOFlagsEnabled);
+                block[6] = uint32_t(BlockStatus.IsFIFOFlagsAsserted);
+                block[7] = 1; // Block enabled
+            }
+        }
+    }
+
+    // Header
+    snapshotCount_++;
+    snapshot_[0] = SNAPSHOT_VERSION;
+    snapshot_[1] = snapshotCount_;
+    snapshot_[2] = sizeof(snapshot_);
+    snapshot_[3] = errors;
+}
+
+void PyRFdc::Snapshot(uint32_t index) {
+    // Check if write
+    if (!rdTxn_) {
+        errMsg_ = "Snapshot(" + std::to_string(index) + "): read only\n";
+
+    // Else read
+    } else {
+        // Reading the first word gathers the whole snapshot, the rest of the window
+        // (same transaction, under the same lock) returns the captured words
+        if (index==0) {
+            CaptureSnapshot();
+        }
+        data_ = snapshot_[index];
+    }
+}
+
+void PyRFdc::AsyncCommand(uint32_t index) {
+    // Check if read
+    if (rdTxn_) {
+        data_ = 1; // Always return 1 so this is a set() and not posted() cmd
+        return;
+    }
+
+    // Only one command at a time
+    {
+        std::lock_guard<std::mutex> lock(asyncMtx_);
+        if (asyncState_ == ASYNC_STATE_BUSY) {
+            errMsg_ = "AsyncCommand(" + std::to_string(index) + "): busy\n";
+            return;
+        }
+        asyncState_ = ASYNC_STATE_BUSY;
+        asyncCmd_   = index;
+    }
+
+    // The previous worker is done (not busy), release it and start the command.
+    // The worker waits on mtx_ until this transaction completes.
+    if (asyncThread_.joinable()) {
+        asyncThread_.join();
+    }
+    asyncThread_ = std::thread(&PyRFdc::AsyncRun, this, index, data_);
+}
+
+void PyRFdc::AsyncRun(uint32_t index, uint32_t data) {
+    std::string errMsg;
+
+    // The XRFdc driver is not reentrant: other register accesses fail with a busy error
+    // (see doTransaction()), only the status words are served meanwhile (see AsyncStatus())
+    {
+        std::lock_guard<std::mutex> lock(mtx_);
+
+        errMsg_.clear();
+        rdTxn_    = false;
+        data_     = data;
+        tileType_ = ((index&0x1) == 0x0) ? XRFDC_ADC_TILE : XRFDC_DAC_TILE;
+
+        if ((index>>1) == 0) {
+            Reset(-1);
+
+        } else if ((index>>1) == 1) {
+            StartUp(-1);
+
+        } else if ((index>>1) == 2) {
+            CustomStartUp(-1);
+
+        } else {
+            MtsSync();
+        }
+
+        if (ignoreMetalError_) {
+            errMsg_.clear();
+        }
+        errMsg = errMsg_;
+        errMsg_.clear();
+    }
+
+    if (!errMsg.empty()) {
+        log_->error(errMsg.c_str());
+    }
+
+    std::lock_guard<std::mutex> lock(asyncMtx_);
+    asyncState_ = errMsg.empty() ? ASYNC_STATE_DONE : ASYNC_STATE_ERROR;
+    asyncCount_++;
+}
+
+bool PyRFdc::AsyncBusy() {
+    std::lock_guard<std::mutex> lock(asyncMtx_);
+    return (asyncState_ == ASYNC_STATE_BUSY);
+}
+
+//! Serve the status words without the driver lock, so they can be polled while a command runs
+void PyRFdc::AsyncStatus(rim::TransactionPtr tran) {
+    uint32_t addr = uint32_t(tran->address() & 0xFFFFFFFFULL);
+    uint32_t size = uint32_t(tran->size());
+    uint8_t* ptr  = tran->begin();
+    uint32_t index;
+    uint32_t data;
+    uint32_t i;
+
+    rim::TransactionLockPtr tlock = tran->lock();
+
+    // Check if write
+    if (tran->type() == rim::Write || tran->type() == rim::Post) {
+        tran->errorStr("AsyncStatus(): read only\n");
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> lock(asyncMtx_);
+        for(i=0; i<size; i+=sizeof(uint32_t)) {
+            index = (addr+i-ASYNC_STATUS_ADDR)>>2;
+            if (index==0) {
+                data = asyncState_;
+            } else if (index==1) {
+                data = asyncCmd_;
+            } else {
+                data = asyncCount_;
+            }
+            memcpy(ptr+i, &data, sizeof(uint32_t));
+        }
+    }
+    tran->done();
+}
+
 void PyRFdc::MetalLogLevel() {
     // Check for a write
     if (!rdTxn_) {
@@ -3254,13 +3475,28 @@ void PyRFdc::doTransaction(rim::TransactionPtr tran) {
     uint32_t blockAddr = 0;
     uint32_t wrdIdx = 0;
     bool tileOnly = false;
+    std::string errMsg;
 
-     // Initialize as an empty string
-     errMsg_.clear();
+    // Async command status, served without the driver lock
+    if ( (addr >= ASYNC_STATUS_ADDR) && ((addr+size) <= (ASYNC_STATUS_ADDR+4*ASYNC_STATUS_WORDS)) ) {
+        AsyncStatus(tran);
+        return;
+    }
 
     rim::TransactionLockPtr tlock = tran->lock();
     {
-        std::lock_guard<std::mutex> lock(mtx_);
+        // Fail fast instead of blocking on the driver lock while an async command runs
+        std::unique_lock<std::mutex> lock(mtx_, std::defer_lock);
+        while (!lock.try_lock()) {
+            if (AsyncBusy()) {
+                tran->errorStr("PyRFdc: busy running an async command, see AsyncState\n");
+                return;
+            }
+            std::this_thread::sleep_for(std::chrono::microseconds(100));
+        }
+
+        // Initialize as an empty string (under the lock, shared with the async worker)
+        errMsg_.clear();
 
         while (size > 0)
         {
@@ -3455,6 +3691,12 @@ void PyRFdc::doTransaction(rim::TransactionPtr tran) {
             } else if ( (addr >= 0x13000) && (addr <= 0x13004) ) {
                 DoubleTestReg(bool((addr>>2)&0x1));
 
+            } else if ( (addr >= SNAPSHOT_ADDR) && (addr < (SNAPSHOT_ADDR+4*SNAPSHOT_WORDS)) ) {
+                Snapshot((addr-SNAPSHOT_ADDR)>>2);
+
+            } else if ( (addr >= ASYNC_ADDR) && (addr < (ASYNC_ADDR+4*ASYNC_CMD_WORDS)) ) {
+                AsyncCommand((addr-ASYNC_ADDR)>>2);
+
             } else if (addr<0x10000) {
 
                 ////////////////////////////////////////////////////////////////
@@ -3757,16 +3999,18 @@ void PyRFdc::doTransaction(rim::TransactionPtr tran) {
             wrdIdx += sizeof(uint32_t);
 
         } // while (size > 0)
+
+        errMsg = errMsg_;
     } // rim::TransactionLockPtr tlock = tran->lock();
 
     // Complete transaction without error
-    if (errMsg_.empty()) {
+    if (errMsg.empty()) {
         tran->done();
 
     // Complete transaction with error message
     } else {
-        log_->error(errMsg_.c_str());
-        tran->errorStr(errMsg_);
+        log_->error(errMsg.c_str());
+        tran->errorStr(errMsg);
     }
 
 }
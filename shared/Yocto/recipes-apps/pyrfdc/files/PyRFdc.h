@@ -26,6 +26,8 @@
 #include <stdint.h>
 
 #include <memory>
+#include <mutex>
+#include <string>
 #include <thread>
 #include <vector>
 
@@ -40,6 +42,25 @@
     #include <boost/python.hpp>
 #endif
 
+//! Status snapshot window, record layout mirrored by rfdcSnapshotDtype in _RfdcSnapshot.py
+#define SNAPSHOT_ADDR        0x14000
+#define SNAPSHOT_VERSION     1
+#define SNAPSHOT_HDR_WORDS   4
+#define SNAPSHOT_TILE_WORDS  8
+#define SNAPSHOT_BLOCK_WORDS 8
+#define SNAPSHOT_WORDS       (SNAPSHOT_HDR_WORDS+8*(SNAPSHOT_TILE_WORDS+4*SNAPSHOT_BLOCK_WORDS))
+
+//! Long running commands run on a worker thread: command words (ResetAll, StartUpAll,
+//! CustomStartUpAll, MTS sync; ADC then DAC) followed by the status words (state, command, count)
+#define ASYNC_ADDR          0x15000
+#define ASYNC_CMD_WORDS     8
+#define ASYNC_STATUS_ADDR   (ASYNC_ADDR+4*ASYNC_CMD_WORDS)
+#define ASYNC_STATUS_WORDS  3
+#define ASYNC_STATE_IDLE    0
+#define ASYNC_STATE_BUSY    1
+#define ASYNC_STATE_DONE    2
+#define ASYNC_STATE_ERROR   3
+
 //! Memory interface Emlator device
 /** This memory will respond to transactions, emilator hardware by responding to read
  * and write transactions.
@@ -72,6 +93,16 @@ class PyRFdc : public rogue::interfaces::memory::Slave {
     XRFdc_MultiConverter_Sync_Config mtsConfig_[2];
     uint32_t mtsfactor_[2][4];
 
+    uint32_t snapshot_[SNAPSHOT_WORDS];
+    uint32_t snapshotCount_;
+
+    //! Worker thread for the long running commands, status protected by asyncMtx_
+    std::thread asyncThread_;
+    std::mutex asyncMtx_;
+    uint32_t asyncState_;
+    uint32_t asyncCmd_;
+    uint32_t asyncCount_;
+
     uint32_t clkSrcDefault_[2][4];
     uint32_t clkSrcConfig_[2][4];
 
@@ -188,6 +219,14 @@ class PyRFdc : public rogue::interfaces::memory::Slave {
     void TileCommonStatus();
     void TileCurrentState();
 
+    void CaptureSnapshot();
+    void Snapshot(uint32_t index);
+
+    void AsyncCommand(uint32_t index);
+    void AsyncRun(uint32_t index, uint32_t data);
+    bool AsyncBusy();
+    void AsyncStatus(std::shared_ptr<rogue::interfaces::memory::Transaction> transaction);
+
     void MetalLogLevel();
     void IgnoreMetalError();
     void ScratchPad();